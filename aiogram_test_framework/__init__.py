@@ -8,27 +8,36 @@ A testing framework for Aiogram 3.x Telegram bots that allows:
 - Testing handlers with full middleware chain
 """
 
-from aiogram_test_framework.types import (
-    CapturedRequest,
-    RequestType,
-)
-from aiogram_test_framework.request_capture import RequestCapture
-from aiogram_test_framework.mock_bot import MockBot
-from aiogram_test_framework.factories import (
-    UserFactory,
-    ChatFactory,
-    MessageFactory,
-    CallbackQueryFactory,
-    UpdateFactory,
-    KeyboardFactory,
-)
-from aiogram_test_framework.client import TestClient
-from aiogram_test_framework.user import TestUser
-from aiogram_test_framework.base import AsyncBotTestMixin
-from aiogram_test_framework.setup import create_test_dispatcher
+import importlib
+from typing import Any
 
 __version__ = "0.1.0"
 
+# Public symbols are imported lazily (PEP 562) so that touching the package
+# does not pull in aiogram's full type system until a symbol is first used.
+_LAZY: dict[str, str] = {
+    # Types
+    "CapturedRequest": "aiogram_test_framework.types",
+    "RequestType": "aiogram_test_framework.types",
+    # Core
+    "RequestCapture": "aiogram_test_framework.request_capture",
+    "MockBot": "aiogram_test_framework.mock_bot",
+    # Factories
+    "UserFactory": "aiogram_test_framework.factories",
+    "ChatFactory": "aiogram_test_framework.factories",
+    "MessageFactory": "aiogram_test_framework.factories",
+    "CallbackQueryFactory": "aiogram_test_framework.factories",
+    "UpdateFactory": "aiogram_test_framework.factories",
+    "KeyboardFactory": "aiogram_test_framework.factories",
+    # Client
+    "TestClient": "aiogram_test_framework.client",
+    "TestUser": "aiogram_test_framework.user",
+    # Base
+    "AsyncBotTestMixin": "aiogram_test_framework.base",
+    # Setup
+    "create_test_dispatcher": "aiogram_test_framework.setup",
+}
+
 __all__ = [
     # Types
     "CapturedRequest",
@@ -51,3 +60,20 @@ __all__ = [
     # Setup
     "create_test_dispatcher",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    module = importlib.import_module(module_name)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
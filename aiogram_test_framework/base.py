@@ -12,12 +12,7 @@ from typing import Callable, Optional
 from aiogram import Dispatcher
 
 from aiogram_test_framework.client import TestClient
-from aiogram_test_framework.factories import (
-    CallbackQueryFactory,
-    MessageFactory,
-    UpdateFactory,
-    UserFactory,
-)
+from aiogram_test_framework.factories import reset_all
 
 
 class AsyncBotTestMixin:
@@ -60,6 +55,27 @@ class AsyncBotTestMixin:
                 await user.send_command("start")
                 assert user.has_received_message_containing("Welcome")
 
+    Session-scoped usage with pytest (one client reused across all tests,
+    avoiding per-test dispatcher setup and startup handlers):
+
+        @pytest.fixture(scope="session")
+        async def bot_client():
+            client = await TestClient.create(
+                bot_token="123456:ABC-DEF",
+                bot_id=123456,
+                bot_username="test_bot",
+                bot_first_name="Test Bot",
+                setup_dispatcher_func=setup_dispatcher,
+            )
+            await client.start()
+            yield client
+            await client.close()
+
+        @pytest.fixture(autouse=True)
+        def reset_bot_client(bot_client):
+            yield
+            bot_client.reset_for_next_test()
+
     Usage with unittest:
         import asyncio
         import unittest
@@ -159,12 +175,9 @@ class AsyncBotTestMixin:
             dispatcher=dispatcher,
             setup_dispatcher_func=setup_dispatcher_func,
         )
-        await client.dispatcher.emit_startup()
+        await client.start()
         return client
 
     def reset_factories(self) -> None:
-        """Reset all factory counters."""
-        UserFactory.reset_counter()
-        MessageFactory.reset_counter()
-        CallbackQueryFactory.reset_counter()
-        UpdateFactory.reset_counter()
+        """Reset all factory counters and caches."""
+        reset_all()
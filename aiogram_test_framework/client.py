@@ -2,9 +2,12 @@
 Test client for simulating user interactions with the bot.
 """
 
-from typing import Callable, Optional, Any
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Optional, Any, Sequence
 
 from aiogram import Dispatcher, Bot
+from aiogram.fsm.storage.memory import MemoryStorage
 from aiogram.types import User, Message, Chat
 
 from aiogram_test_framework.user import TestUser
@@ -15,9 +18,11 @@ from aiogram_test_framework.types import CapturedRequest
 from aiogram_test_framework.factories import (
     ChatFactory,
     UserFactory,
-    MessageFactory,
-    CallbackQueryFactory,
     UpdateFactory,
+    _make_callback_update,
+    _make_command_update,
+    _make_text_update,
+    reset_all,
 )
 
 
@@ -62,6 +67,8 @@ class TestClient:
             assert user.has_received_message_containing("Welcome")
     """
 
+    __slots__ = ("_dispatcher", "_bot", "_capture", "_started")
+
     def __init__(
         self,
         dispatcher: Dispatcher,
@@ -71,6 +78,7 @@ class TestClient:
         self._dispatcher = dispatcher
         self._bot = bot
         self._capture = capture
+        self._started = False
 
     @classmethod
     async def create(
@@ -81,6 +89,8 @@ class TestClient:
         bot_first_name: str,
         dispatcher: Optional[Dispatcher] = None,
         setup_dispatcher_func: Optional[Callable[[Bot, Dispatcher], None]] = None,
+        bot: Optional[MockBot] = None,
+        capture: Optional[RequestCapture] = None,
     ) -> "TestClient":
         """
         Create a new TestClient with the dispatcher set up.
@@ -96,23 +106,36 @@ class TestClient:
                 Should accept a Bot and Dispatcher instance and configure it
                 (register handlers, middlewares, etc.). If None, dispatcher is
                 used as-is without additional configuration.
+            bot: Optional pre-built MockBot to reuse (e.g., from a
+                session-scoped fixture). When provided together with capture,
+                bot construction and setup_dispatcher_func are skipped —
+                the caller is expected to have configured the dispatcher
+                already. Call reset_for_next_test() between tests.
+            capture: Optional pre-built RequestCapture to reuse. Defaults to
+                bot.capture when a pre-built bot is given.
 
         Returns:
             Configured TestClient instance
         """
-        capture = RequestCapture()
-        bot = MockBot(
-            capture=capture,
-            token=bot_token,
-            bot_id=bot_id,
-            bot_username=bot_username,
-            bot_first_name=bot_first_name,
-        )
+        reusing_bot = bot is not None
+
+        if bot is None:
+            if capture is None:
+                capture = RequestCapture()
+            bot = MockBot(
+                capture=capture,
+                token=bot_token,
+                bot_id=bot_id,
+                bot_username=bot_username,
+                bot_first_name=bot_first_name,
+            )
+        elif capture is None:
+            capture = bot.capture
 
         if dispatcher is None:
             dispatcher = create_test_dispatcher()
 
-        if setup_dispatcher_func is not None:
+        if setup_dispatcher_func is not None and not reusing_bot:
             setup_dispatcher_func(bot, dispatcher)
 
         return cls(
@@ -121,6 +144,27 @@ class TestClient:
             capture=capture,
         )
 
+    @classmethod
+    @asynccontextmanager
+    async def session(cls, **kwargs: Any) -> AsyncIterator["TestClient"]:
+        """
+        Create a TestClient as an async context manager in one step.
+
+        Equivalent to ``async with await TestClient.create(...)`` but
+        with a single suspension point and guaranteed close():
+
+            async with TestClient.session(bot_token=..., ...) as client:
+                ...
+
+        Accepts the same keyword arguments as create().
+        """
+        client = await cls.create(**kwargs)
+        await client.start()
+        try:
+            yield client
+        finally:
+            await client.close()
+
     @property
     def dispatcher(self) -> Dispatcher:
         """Get the dispatcher."""
@@ -157,13 +201,21 @@ class TestClient:
         Returns:
             TestUser instance for interacting with the bot
         """
-        user = UserFactory.create(
-            user_id=user_id,
-            first_name=first_name,
-            last_name=last_name,
-            username=username,
-            language_code=language_code,
-        )
+        if (
+            first_name == "Test"
+            and last_name == "User"
+            and username is None
+            and language_code == "en"
+        ):
+            user = UserFactory.create_default(user_id)
+        else:
+            user = UserFactory.create(
+                user_id=user_id,
+                first_name=first_name,
+                last_name=last_name,
+                username=username,
+                language_code=language_code,
+            )
 
         test_user = TestUser(
             client=self,
@@ -172,12 +224,23 @@ class TestClient:
         )
         return test_user
 
+    async def _feed(self, update: Any) -> Sequence[CapturedRequest]:
+        """
+        Dispatch an update and return a snapshot of its captured requests.
+
+        The returned view is bounded at the post-dispatch mark, so it is
+        zero-copy but does not grow when later sends add captures.
+        """
+        start = self._capture.mark()
+        await self._dispatcher.feed_update(bot=self._bot, update=update)
+        return self._capture.view(start, self._capture.mark())
+
     async def send_message(
         self,
         text: str,
         from_user: User,
         chat: Optional[Chat] = None,
-    ) -> list[CapturedRequest]:
+    ) -> Sequence[CapturedRequest]:
         """
         Send a message to the bot and return captured responses.
 
@@ -189,17 +252,9 @@ class TestClient:
         Returns:
             List of captured requests made by the bot
         """
-        initial_count = len(self._capture)
+        update = _make_text_update(text, from_user, chat)
 
-        update = UpdateFactory.from_text(
-            text=text,
-            from_user=from_user,
-            chat=chat,
-        )
-
-        await self._dispatcher.feed_update(bot=self._bot, update=update)
-
-        return self._capture.all_requests[initial_count:]
+        return await self._feed(update)
 
     async def send_command(
         self,
@@ -207,7 +262,7 @@ class TestClient:
         from_user: User,
         args: Optional[str] = None,
         chat: Optional[Chat] = None,
-    ) -> list[CapturedRequest]:
+    ) -> Sequence[CapturedRequest]:
         """
         Send a command to the bot.
 
@@ -220,25 +275,16 @@ class TestClient:
         Returns:
             List of captured requests made by the bot
         """
-        initial_count = len(self._capture)
+        update = _make_command_update(command, from_user, args, chat)
 
-        update = UpdateFactory.from_command(
-            command=command,
-            from_user=from_user,
-            args=args,
-            chat=chat,
-        )
-
-        await self._dispatcher.feed_update(bot=self._bot, update=update)
-
-        return self._capture.all_requests[initial_count:]
+        return await self._feed(update)
 
     async def send_callback(
         self,
         data: str,
         from_user: User,
         message: Optional[Message] = None,
-    ) -> list[CapturedRequest]:
+    ) -> Sequence[CapturedRequest]:
         """
         Send a callback query (button click) to the bot.
 
@@ -250,17 +296,9 @@ class TestClient:
         Returns:
             List of captured requests made by the bot
         """
-        initial_count = len(self._capture)
+        update = _make_callback_update(data, from_user, message)
 
-        update = UpdateFactory.from_callback(
-            data=data,
-            from_user=from_user,
-            message=message,
-        )
-
-        await self._dispatcher.feed_update(bot=self._bot, update=update)
-
-        return self._capture.all_requests[initial_count:]
+        return await self._feed(update)
 
     async def send_dice(
         self,
@@ -268,7 +306,7 @@ class TestClient:
         value: Optional[int] = None,
         emoji: str = "🎲",
         chat: Optional[Chat] = None,
-    ) -> list[CapturedRequest]:
+    ) -> Sequence[CapturedRequest]:
         """
         Send a dice message to the bot.
 
@@ -281,8 +319,6 @@ class TestClient:
         Returns:
             List of captured requests made by the bot
         """
-        initial_count = len(self._capture)
-
         update = UpdateFactory.from_dice(
             from_user=from_user,
             value=value,
@@ -290,9 +326,7 @@ class TestClient:
             chat=chat,
         )
 
-        await self._dispatcher.feed_update(bot=self._bot, update=update)
-
-        return self._capture.all_requests[initial_count:]
+        return await self._feed(update)
 
     async def send_forwarded_from_user(
         self,
@@ -300,7 +334,7 @@ class TestClient:
         from_user: User,
         forward_from: User,
         chat: Optional[Chat] = None,
-    ) -> list[CapturedRequest]:
+    ) -> Sequence[CapturedRequest]:
         """
         Send a forwarded message from another user to the bot.
 
@@ -313,8 +347,6 @@ class TestClient:
         Returns:
             List of captured requests made by the bot
         """
-        initial_count = len(self._capture)
-
         update = UpdateFactory.from_forwarded_user(
             text=text,
             from_user=from_user,
@@ -322,9 +354,7 @@ class TestClient:
             chat=chat,
         )
 
-        await self._dispatcher.feed_update(bot=self._bot, update=update)
-
-        return self._capture.all_requests[initial_count:]
+        return await self._feed(update)
 
     async def send_forwarded_from_hidden_user(
         self,
@@ -332,7 +362,7 @@ class TestClient:
         from_user: User,
         sender_user_name: str,
         chat: Optional[Chat] = None,
-    ) -> list[CapturedRequest]:
+    ) -> Sequence[CapturedRequest]:
         """
         Send a forwarded message from a hidden user to the bot.
 
@@ -345,8 +375,6 @@ class TestClient:
         Returns:
             List of captured requests made by the bot
         """
-        initial_count = len(self._capture)
-
         update = UpdateFactory.from_forwarded_hidden_user(
             text=text,
             from_user=from_user,
@@ -354,9 +382,7 @@ class TestClient:
             chat=chat,
         )
 
-        await self._dispatcher.feed_update(bot=self._bot, update=update)
-
-        return self._capture.all_requests[initial_count:]
+        return await self._feed(update)
 
     async def send_forwarded_from_chat(
         self,
@@ -365,7 +391,7 @@ class TestClient:
         sender_chat: Chat,
         chat: Optional[Chat] = None,
         author_signature: Optional[str] = None,
-    ) -> list[CapturedRequest]:
+    ) -> Sequence[CapturedRequest]:
         """
         Send a forwarded message from a chat to the bot.
 
@@ -379,8 +405,6 @@ class TestClient:
         Returns:
             List of captured requests made by the bot
         """
-        initial_count = len(self._capture)
-
         update = UpdateFactory.from_forwarded_chat(
             text=text,
             from_user=from_user,
@@ -389,9 +413,7 @@ class TestClient:
             author_signature=author_signature,
         )
 
-        await self._dispatcher.feed_update(bot=self._bot, update=update)
-
-        return self._capture.all_requests[initial_count:]
+        return await self._feed(update)
 
     async def send_forwarded_from_channel(
         self,
@@ -401,7 +423,7 @@ class TestClient:
         channel_message_id: int,
         chat: Optional[Chat] = None,
         author_signature: Optional[str] = None,
-    ) -> list[CapturedRequest]:
+    ) -> Sequence[CapturedRequest]:
         """
         Send a forwarded message from a channel to the bot.
 
@@ -416,8 +438,6 @@ class TestClient:
         Returns:
             List of captured requests made by the bot
         """
-        initial_count = len(self._capture)
-
         update = UpdateFactory.from_forwarded_channel(
             text=text,
             from_user=from_user,
@@ -427,9 +447,7 @@ class TestClient:
             author_signature=author_signature,
         )
 
-        await self._dispatcher.feed_update(bot=self._bot, update=update)
-
-        return self._capture.all_requests[initial_count:]
+        return await self._feed(update)
 
     def set_next_dice_value(self, value: int) -> None:
         """
@@ -445,19 +463,63 @@ class TestClient:
         self._bot.set_next_dice_value(value)
 
     def reset(self) -> None:
-        """Reset the client state (clear captured requests and counters)."""
+        """
+        Reset the client state (clear captured requests and counters).
+
+        With ``AIOGRAM_TF_FAST_RESET`` set in the environment, only the
+        capture, message counter and in-memory FSM state are cleared;
+        factory counters, caches and RNG seeds are left alone. Suites
+        that don't assert on factory-assigned ids can export the flag
+        to skip the global factory reset.
+        """
         self._capture.clear()
         self._bot.reset_message_counter()
-        UserFactory.reset_counter()
-        MessageFactory.reset_counter()
-        CallbackQueryFactory.reset_counter()
-        UpdateFactory.reset_counter()
+        if os.environ.get("AIOGRAM_TF_FAST_RESET"):
+            self._clear_fsm_storage()
+            return
+        reset_all()
+
+    def reset_for_next_test(self) -> None:
+        """
+        Reset per-test state while keeping the client alive.
+
+        Intended for session-scoped fixtures that reuse one client across
+        tests: clears captured requests, resets the bot message counter,
+        resets all factories and wipes in-memory FSM state, but leaves
+        the dispatcher running.
+        """
+        self._capture.clear()
+        self._bot.reset_message_counter()
+        reset_all()
+        # Factory counters restart after reset_all(), so user/chat ids
+        # repeat across tests; stale FSM state for those ids must go too.
+        self._clear_fsm_storage()
+
+    def _clear_fsm_storage(self) -> None:
+        """Wipe in-memory FSM state, if the dispatcher uses MemoryStorage."""
+        storage = self._dispatcher.storage
+        if isinstance(storage, MemoryStorage):
+            storage.storage.clear()
+
+    async def start(self) -> None:
+        """
+        Emit dispatcher startup handlers (idempotent).
+
+        Safe to call multiple times — startup handlers run only once, so
+        combining setup_client() with the context manager does not run
+        them twice.
+        """
+        if not self._started:
+            await self._dispatcher.emit_startup()
+            self._started = True
 
     async def close(self) -> None:
         """Close the client and clean up resources."""
         # Reset all routers so they can be reused in next test
         self._reset_dispatcher_routers(self._dispatcher)
-        await self._dispatcher.emit_shutdown()
+        if self._started:
+            await self._dispatcher.emit_shutdown()
+            self._started = False
 
     def _reset_dispatcher_routers(self, router: Any) -> None:
         """
@@ -473,7 +535,7 @@ class TestClient:
 
     async def __aenter__(self) -> "TestClient":
         """Async context manager entry."""
-        await self._dispatcher.emit_startup()
+        await self.start()
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
@@ -2,9 +2,13 @@
 Factories for creating mock Telegram objects for testing.
 """
 
+import itertools
 import random
-from datetime import datetime
-from typing import Optional, Any
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import ClassVar, Iterator, Optional, Any
+from weakref import WeakValueDictionary
 
 from aiogram.types import (
     User,
@@ -22,11 +26,70 @@ from aiogram.types import (
     MessageOriginChannel,
 )
 
+# When True (the default), factories build models with model_construct(),
+# skipping Pydantic validation. The factories fully control their inputs so
+# validation is redundant; set to False if a compatibility issue comes up.
+FACTORIES_SKIP_VALIDATION = True
 
+
+def _construct(model: type, **kwargs: Any) -> Any:
+    """Build a model, bypassing validation when FACTORIES_SKIP_VALIDATION."""
+    if FACTORIES_SKIP_VALIDATION:
+        return model.model_construct(**kwargs)
+    return model(**kwargs)
+
+
+@lru_cache(maxsize=128)
+def _slash(command: str) -> str:
+    """Build a "/command" string, cached for repeated argless commands."""
+    return f"/{command}"
+
+
+def _peek_count(counter: "itertools.count") -> int:
+    """Read the next value of an itertools.count without consuming it."""
+    # count exposes its current value only through its pickle protocol.
+    return counter.__reduce__()[1][0]
+
+
+# Registry of factory classes reset by reset_all(); new factories register
+# themselves with @_resettable so tear-down can't silently miss one.
+_RESETTABLE: list[type] = []
+
+
+def _resettable(cls: type) -> type:
+    """Register a factory class to be reset by reset_all()."""
+    _RESETTABLE.append(cls)
+    return cls
+
+
+def reset_all() -> None:
+    """Reset all factory counters and clear all factory caches."""
+    for factory in _RESETTABLE:
+        reset_counter = getattr(factory, "reset_counter", None)
+        if reset_counter is not None:
+            reset_counter()
+        clear_cache = getattr(factory, "clear_cache", None)
+        if clear_cache is not None:
+            clear_cache()
+
+
+@_resettable
 class UserFactory:
     """Factory for creating mock Telegram User objects."""
 
-    _user_id_counter = 100000
+    _user_id_iter = itertools.count(100000)
+
+    # Pre-validated template reused via model_copy() to skip repeated
+    # Pydantic validation on the hot path (tests that only vary id/username).
+    _template: ClassVar[User] = User(
+        id=0,
+        is_bot=False,
+        first_name="Test",
+        last_name="User",
+        username="test_user_0",
+        language_code="en",
+        is_premium=False,
+    )
 
     @classmethod
     def create(
@@ -41,13 +104,24 @@ class UserFactory:
     ) -> User:
         """Create a mock User object."""
         if user_id is None:
-            user_id = cls._user_id_counter
-            cls._user_id_counter += 1
+            user_id = next(cls._user_id_iter)
 
         if username is None:
             username = f"test_user_{user_id}"
 
-        return User(
+        if (
+            first_name == "Test"
+            and last_name == "User"
+            and language_code == "en"
+            and not is_bot
+            and not is_premium
+        ):
+            return cls._template.model_copy(
+                update={"id": user_id, "username": username}
+            )
+
+        return _construct(
+            User,
             id=user_id,
             is_bot=is_bot,
             first_name=first_name,
@@ -57,15 +131,68 @@ class UserFactory:
             is_premium=is_premium,
         )
 
+    @classmethod
+    def create_default(cls, user_id: Optional[int] = None) -> User:
+        """
+        Create a mock User with all default fields, varying only the id.
+
+        Fast path for the common all-defaults case: a single model_copy
+        of the template with the id and derived username updated.
+        """
+        if user_id is None:
+            user_id = next(cls._user_id_iter)
+        return cls._template.model_copy(
+            update={"id": user_id, "username": f"test_user_{user_id}"}
+        )
+
+    @classmethod
+    def peek_next_id(cls) -> int:
+        """Return the id the next created user will get, without
+        consuming the counter or building a User."""
+        return _peek_count(cls._user_id_iter)
+
+    @classmethod
+    @contextmanager
+    def frozen_counter(cls, start: int = 100000) -> Iterator[None]:
+        """Run a block with the id counter at a known start, then
+        restore the previous counter position.
+
+        Lets a test get deterministic ids without resetting global
+        state for everything that runs after it.
+        """
+        saved = cls._user_id_iter
+        cls._user_id_iter = itertools.count(start)
+        try:
+            yield
+        finally:
+            cls._user_id_iter = saved
+
     @classmethod
     def reset_counter(cls) -> None:
         """Reset the user ID counter."""
-        cls._user_id_counter = 100000
+        cls._user_id_iter = itertools.count(100000)
 
 
+@_resettable
 class ChatFactory:
     """Factory for creating mock Telegram Chat objects."""
 
+    # Pre-validated template reused via model_copy() to skip repeated
+    # Pydantic validation when only id/username vary.
+    _private_template: ClassVar[Chat] = Chat(
+        id=0,
+        type="private",
+        first_name="Test",
+        last_name="User",
+        username="test_user_0",
+    )
+
+    # Memoizes private chats per user id so the same Chat is reused across
+    # all messages a user sends instead of being rebuilt per message.
+    _private_chat_cache: ClassVar["WeakValueDictionary[int, Chat]"] = (
+        WeakValueDictionary()
+    )
+
     @classmethod
     def create_private(
         cls,
@@ -75,7 +202,16 @@ class ChatFactory:
         username: Optional[str] = None,
     ) -> Chat:
         """Create a private chat."""
-        return Chat(
+        if first_name == "Test" and last_name == "User":
+            return cls._private_template.model_copy(
+                update={
+                    "id": chat_id,
+                    "username": username or f"test_user_{chat_id}",
+                }
+            )
+
+        return _construct(
+            Chat,
             id=chat_id,
             type="private",
             first_name=first_name,
@@ -85,13 +221,22 @@ class ChatFactory:
 
     @classmethod
     def create_private_from_user(cls, user: User) -> Chat:
-        """Create a private chat from a User object."""
-        return cls.create_private(
-            chat_id=user.id,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            username=user.username,
-        )
+        """Create a private chat from a User object (cached per user id)."""
+        chat = cls._private_chat_cache.get(user.id)
+        if chat is None:
+            chat = cls.create_private(
+                chat_id=user.id,
+                first_name=user.first_name,
+                last_name=user.last_name,
+                username=user.username,
+            )
+            cls._private_chat_cache[user.id] = chat
+        return chat
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the private chat cache."""
+        cls._private_chat_cache.clear()
 
     @classmethod
     def create_group(
@@ -100,17 +245,33 @@ class ChatFactory:
         title: str = "Test Group",
     ) -> Chat:
         """Create a group chat."""
-        return Chat(
+        return _construct(
+            Chat,
             id=chat_id,
             type="group",
             title=title,
         )
 
 
+@_resettable
 class MessageFactory:
     """Factory for creating mock Telegram Message objects."""
 
-    _message_id_counter = 1
+    _message_id_iter = itertools.count(1)
+
+    # Dedicated RNG so dice rolls are deterministic across runs and do not
+    # touch the module-global random state; re-seeded by reset_counter().
+    _rng: ClassVar[random.Random] = random.Random(0)
+
+    # Fixed default date used when no date is provided. A constant avoids
+    # a clock read per message; tests that care about the exact time can
+    # pass date= explicitly or call set_default_date().
+    _default_date: ClassVar[datetime] = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    @classmethod
+    def set_default_date(cls, date: datetime) -> None:
+        """Set the default date used for messages created without a date."""
+        cls._default_date = date
 
     @classmethod
     def create(
@@ -132,7 +293,7 @@ class MessageFactory:
             from_user: User who sent the message
             chat: Chat where message was sent (auto-created from user if not provided)
             message_id: Message ID (auto-generated if not provided)
-            date: Message date (defaults to now)
+            date: Message date (defaults to a fixed test date)
             reply_to_message: Message being replied to
             reply_markup: Inline keyboard attached to message
             entities: Message entities (mentions, commands, etc.)
@@ -141,21 +302,16 @@ class MessageFactory:
             Mock Message object
         """
         if message_id is None:
-            message_id = cls._message_id_counter
-            cls._message_id_counter += 1
+            message_id = next(cls._message_id_iter)
 
         if chat is None:
-            chat = ChatFactory.create_private(
-                chat_id=from_user.id,
-                first_name=from_user.first_name,
-                last_name=from_user.last_name,
-                username=from_user.username,
-            )
+            chat = ChatFactory.create_private_from_user(from_user)
 
         if date is None:
-            date = datetime.now()
+            date = cls._default_date
 
-        return Message(
+        return _construct(
+            Message,
             message_id=message_id,
             date=date,
             chat=chat,
@@ -176,9 +332,7 @@ class MessageFactory:
         message_id: Optional[int] = None,
     ) -> Message:
         """Create a command message (e.g., /start, /help)."""
-        text = f"/{command}"
-        if args:
-            text = f"{text} {args}"
+        text = f"/{command} {args}" if args else _slash(command)
 
         return cls.create(
             text=text,
@@ -187,24 +341,28 @@ class MessageFactory:
             message_id=message_id,
         )
 
+    # Valid value ranges per dice emoji type:
+    # 🎲 (dice), 🎯 (darts), 🎳 (bowling): 1-6
+    # 🏀 (basketball), ⚽ (football/soccer): 1-5
+    # 🎰 (slot machine): 1-64
+    _DICE_RANGES: ClassVar[dict[str, tuple[int, int]]] = {
+        "🎲": (1, 6),
+        "🎯": (1, 6),
+        "🎳": (1, 6),
+        "🏀": (1, 5),
+        "⚽": (1, 5),
+        "🎰": (1, 64),
+    }
+
     @classmethod
     def _get_dice_value_range(cls, emoji: str) -> tuple[int, int]:
         """Get the valid value range for a dice emoji type."""
-        # 🎲 (dice), 🎯 (darts), 🎳 (bowling): 1-6
-        # 🏀 (basketball), ⚽ (football/soccer): 1-5
-        # 🎰 (slot machine): 1-64
-        if emoji in ("🏀", "⚽"):
-            return (1, 5)
-        elif emoji == "🎰":
-            return (1, 64)
-        else:  # 🎲, 🎯, 🎳 and others
-            return (1, 6)
+        return cls._DICE_RANGES.get(emoji, (1, 6))
 
     @classmethod
     def _get_random_dice_value(cls, emoji: str) -> int:
         """Get a random dice value based on emoji type."""
-        min_val, max_val = cls._get_dice_value_range(emoji)
-        return random.randint(min_val, max_val)
+        return cls._rng.randint(*cls._DICE_RANGES.get(emoji, (1, 6)))
 
     @classmethod
     def _validate_dice_value(cls, value: int, emoji: str) -> None:
@@ -236,7 +394,7 @@ class MessageFactory:
             emoji: Dice emoji type (🎲, 🎯, 🏀, ⚽, 🎳, 🎰)
             chat: Chat where message was sent (auto-created from user if not provided)
             message_id: Message ID (auto-generated if not provided)
-            date: Message date (defaults to now)
+            date: Message date (defaults to a fixed test date)
 
         Returns:
             Mock Message object with dice
@@ -245,31 +403,30 @@ class MessageFactory:
             ValueError: If value is set and out of valid range for the emoji
         """
         if message_id is None:
-            message_id = cls._message_id_counter
-            cls._message_id_counter += 1
+            message_id = next(cls._message_id_iter)
 
         if chat is None:
-            chat = ChatFactory.create_private(
-                chat_id=from_user.id,
-                first_name=from_user.first_name,
-                last_name=from_user.last_name,
-                username=from_user.username,
-            )
+            chat = ChatFactory.create_private_from_user(from_user)
 
         if date is None:
-            date = datetime.now()
+            date = cls._default_date
 
+        min_val, max_val = cls._get_dice_value_range(emoji)
         if value is None:
-            value = cls._get_random_dice_value(emoji)
-        else:
-            cls._validate_dice_value(value, emoji)
+            value = cls._rng.randint(min_val, max_val)
+        elif not (min_val <= value <= max_val):
+            raise ValueError(
+                f"Dice value {value} is out of range for emoji '{emoji}'. "
+                f"Valid range is {min_val}-{max_val}."
+            )
 
-        return Message(
+        return _construct(
+            Message,
             message_id=message_id,
             date=date,
             chat=chat,
             from_user=from_user,
-            dice=Dice(emoji=emoji, value=value),
+            dice=_construct(Dice, emoji=emoji, value=value),
         )
 
     @classmethod
@@ -292,29 +449,23 @@ class MessageFactory:
             forward_from: Original sender of the message
             chat: Chat where message was sent (auto-created from user if not provided)
             message_id: Message ID (auto-generated if not provided)
-            date: Message date (defaults to now)
-            forward_date: Date when original message was sent (defaults to now)
+            date: Message date (defaults to a fixed test date)
+            forward_date: Date when original message was sent (defaults to a fixed test date)
 
         Returns:
             Mock Message object with forward_origin
         """
         if message_id is None:
-            message_id = cls._message_id_counter
-            cls._message_id_counter += 1
+            message_id = next(cls._message_id_iter)
 
         if chat is None:
-            chat = ChatFactory.create_private(
-                chat_id=from_user.id,
-                first_name=from_user.first_name,
-                last_name=from_user.last_name,
-                username=from_user.username,
-            )
+            chat = ChatFactory.create_private_from_user(from_user)
 
         if date is None:
-            date = datetime.now()
+            date = cls._default_date
 
         if forward_date is None:
-            forward_date = datetime.now()
+            forward_date = cls._default_date
 
         forward_origin = MessageOriginUser(
             type="user",
@@ -351,29 +502,23 @@ class MessageFactory:
             sender_user_name: Name of the hidden sender
             chat: Chat where message was sent (auto-created from user if not provided)
             message_id: Message ID (auto-generated if not provided)
-            date: Message date (defaults to now)
-            forward_date: Date when original message was sent (defaults to now)
+            date: Message date (defaults to a fixed test date)
+            forward_date: Date when original message was sent (defaults to a fixed test date)
 
         Returns:
             Mock Message object with forward_origin (hidden user)
         """
         if message_id is None:
-            message_id = cls._message_id_counter
-            cls._message_id_counter += 1
+            message_id = next(cls._message_id_iter)
 
         if chat is None:
-            chat = ChatFactory.create_private(
-                chat_id=from_user.id,
-                first_name=from_user.first_name,
-                last_name=from_user.last_name,
-                username=from_user.username,
-            )
+            chat = ChatFactory.create_private_from_user(from_user)
 
         if date is None:
-            date = datetime.now()
+            date = cls._default_date
 
         if forward_date is None:
-            forward_date = datetime.now()
+            forward_date = cls._default_date
 
         forward_origin = MessageOriginHiddenUser(
             type="hidden_user",
@@ -411,30 +556,24 @@ class MessageFactory:
             sender_chat: Chat from which the message was originally sent
             chat: Chat where message was sent (auto-created from user if not provided)
             message_id: Message ID (auto-generated if not provided)
-            date: Message date (defaults to now)
-            forward_date: Date when original message was sent (defaults to now)
+            date: Message date (defaults to a fixed test date)
+            forward_date: Date when original message was sent (defaults to a fixed test date)
             author_signature: Optional signature of the post author
 
         Returns:
             Mock Message object with forward_origin (chat)
         """
         if message_id is None:
-            message_id = cls._message_id_counter
-            cls._message_id_counter += 1
+            message_id = next(cls._message_id_iter)
 
         if chat is None:
-            chat = ChatFactory.create_private(
-                chat_id=from_user.id,
-                first_name=from_user.first_name,
-                last_name=from_user.last_name,
-                username=from_user.username,
-            )
+            chat = ChatFactory.create_private_from_user(from_user)
 
         if date is None:
-            date = datetime.now()
+            date = cls._default_date
 
         if forward_date is None:
-            forward_date = datetime.now()
+            forward_date = cls._default_date
 
         forward_origin = MessageOriginChat(
             type="chat",
@@ -475,30 +614,24 @@ class MessageFactory:
             channel_message_id: Message ID in the original channel
             chat: Chat where message was sent (auto-created from user if not provided)
             message_id: Message ID (auto-generated if not provided)
-            date: Message date (defaults to now)
-            forward_date: Date when original message was sent (defaults to now)
+            date: Message date (defaults to a fixed test date)
+            forward_date: Date when original message was sent (defaults to a fixed test date)
             author_signature: Optional signature of the post author
 
         Returns:
             Mock Message object with forward_origin (channel)
         """
         if message_id is None:
-            message_id = cls._message_id_counter
-            cls._message_id_counter += 1
+            message_id = next(cls._message_id_iter)
 
         if chat is None:
-            chat = ChatFactory.create_private(
-                chat_id=from_user.id,
-                first_name=from_user.first_name,
-                last_name=from_user.last_name,
-                username=from_user.username,
-            )
+            chat = ChatFactory.create_private_from_user(from_user)
 
         if date is None:
-            date = datetime.now()
+            date = cls._default_date
 
         if forward_date is None:
-            forward_date = datetime.now()
+            forward_date = cls._default_date
 
         forward_origin = MessageOriginChannel(
             type="channel",
@@ -517,16 +650,42 @@ class MessageFactory:
             forward_origin=forward_origin,
         )
 
+    @classmethod
+    def seed(cls, n: int) -> None:
+        """Re-seed the RNG used for random dice values."""
+        cls._rng.seed(n)
+
+    @classmethod
+    def peek_next_id(cls) -> int:
+        """Return the id the next created message will get, without
+        consuming the counter or building a Message."""
+        return _peek_count(cls._message_id_iter)
+
     @classmethod
     def reset_counter(cls) -> None:
-        """Reset the message ID counter."""
-        cls._message_id_counter = 1
+        """Reset the message ID counter and re-seed the dice RNG."""
+        cls._message_id_iter = itertools.count(1)
+        cls.seed(0)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the cached command strings."""
+        _slash.cache_clear()
 
 
+@_resettable
 class CallbackQueryFactory:
     """Factory for creating mock CallbackQuery objects."""
 
-    _callback_id_counter = 1
+    _callback_id_iter = itertools.count(1)
+
+    # Pre-validated bot user reused for the fallback "Button message";
+    # it is identical for every callback built without an explicit message.
+    _BOT_USER: ClassVar[User] = User(
+        id=123456,
+        is_bot=True,
+        first_name="TestBot",
+    )
 
     @classmethod
     def create(
@@ -539,24 +698,17 @@ class CallbackQueryFactory:
     ) -> CallbackQuery:
         """Create a mock CallbackQuery object."""
         if callback_id is None:
-            callback_id = str(cls._callback_id_counter)
-            cls._callback_id_counter += 1
+            callback_id = str(next(cls._callback_id_iter))
 
         if message is None:
             message = MessageFactory.create(
                 text="Button message",
-                from_user=User(
-                    id=123456,
-                    is_bot=True,
-                    first_name="TestBot",
-                ),
-                chat=ChatFactory.create_private(
-                    chat_id=from_user.id,
-                    first_name=from_user.first_name,
-                ),
+                from_user=cls._BOT_USER,
+                chat=ChatFactory.create_private_from_user(from_user),
             )
 
-        return CallbackQuery(
+        return _construct(
+            CallbackQuery,
             id=callback_id,
             from_user=from_user,
             chat_instance=chat_instance,
@@ -564,16 +716,23 @@ class CallbackQueryFactory:
             data=data,
         )
 
+    @classmethod
+    def peek_next_id(cls) -> int:
+        """Return the id the next created callback query will get,
+        without consuming the counter."""
+        return _peek_count(cls._callback_id_iter)
+
     @classmethod
     def reset_counter(cls) -> None:
         """Reset the callback ID counter."""
-        cls._callback_id_counter = 1
+        cls._callback_id_iter = itertools.count(1)
 
 
+@_resettable
 class UpdateFactory:
     """Factory for creating mock Update objects."""
 
-    _update_id_counter = 1
+    _update_id_iter = itertools.count(1)
 
     @classmethod
     def create_message_update(
@@ -583,10 +742,10 @@ class UpdateFactory:
     ) -> Update:
         """Create an Update with a message."""
         if update_id is None:
-            update_id = cls._update_id_counter
-            cls._update_id_counter += 1
+            update_id = next(cls._update_id_iter)
 
-        return Update(
+        return _construct(
+            Update,
             update_id=update_id,
             message=message,
         )
@@ -599,10 +758,10 @@ class UpdateFactory:
     ) -> Update:
         """Create an Update with a callback query."""
         if update_id is None:
-            update_id = cls._update_id_counter
-            cls._update_id_counter += 1
+            update_id = next(cls._update_id_iter)
 
-        return Update(
+        return _construct(
+            Update,
             update_id=update_id,
             callback_query=callback_query,
         )
@@ -615,12 +774,7 @@ class UpdateFactory:
         chat: Optional[Chat] = None,
     ) -> Update:
         """Create an Update from text message."""
-        message = MessageFactory.create(
-            text=text,
-            from_user=from_user,
-            chat=chat,
-        )
-        return cls.create_message_update(message)
+        return _make_text_update(text, from_user, chat)
 
     @classmethod
     def from_command(
@@ -631,13 +785,7 @@ class UpdateFactory:
         chat: Optional[Chat] = None,
     ) -> Update:
         """Create an Update from a command."""
-        message = MessageFactory.create_command(
-            command=command,
-            from_user=from_user,
-            args=args,
-            chat=chat,
-        )
-        return cls.create_message_update(message)
+        return _make_command_update(command, from_user, args, chat)
 
     @classmethod
     def from_callback(
@@ -647,12 +795,7 @@ class UpdateFactory:
         message: Optional[Message] = None,
     ) -> Update:
         """Create an Update from a callback query."""
-        callback = CallbackQueryFactory.create(
-            data=data,
-            from_user=from_user,
-            message=message,
-        )
-        return cls.create_callback_update(callback)
+        return _make_callback_update(data, from_user, message)
 
     @classmethod
     def from_dice(
@@ -803,12 +946,77 @@ class UpdateFactory:
         )
         return cls.create_message_update(message)
 
+    @classmethod
+    def peek_next_id(cls) -> int:
+        """Return the id the next created update will get, without
+        consuming the counter."""
+        return _peek_count(cls._update_id_iter)
+
     @classmethod
     def reset_counter(cls) -> None:
         """Reset the update ID counter."""
-        cls._update_id_counter = 1
+        cls._update_id_iter = itertools.count(1)
+
+
+# Flat builders for the hottest TestClient send paths: they fuse the
+# factory call chain into one frame per update, skipping the classmethod
+# dispatch of the public from_* wrappers.
+def _make_text_update(
+    text: str,
+    from_user: User,
+    chat: Optional[Chat] = None,
+) -> Update:
+    """Build a text-message Update in a single call frame."""
+    return _construct(
+        Update,
+        update_id=next(UpdateFactory._update_id_iter),
+        message=MessageFactory.create(text=text, from_user=from_user, chat=chat),
+    )
+
+
+def _make_command_update(
+    command: str,
+    from_user: User,
+    args: Optional[str] = None,
+    chat: Optional[Chat] = None,
+) -> Update:
+    """Build a command Update in a single call frame."""
+    return _construct(
+        Update,
+        update_id=next(UpdateFactory._update_id_iter),
+        message=MessageFactory.create_command(
+            command=command,
+            from_user=from_user,
+            args=args,
+            chat=chat,
+        ),
+    )
+
+
+def _make_callback_update(
+    data: str,
+    from_user: User,
+    message: Optional[Message] = None,
+) -> Update:
+    """Build a callback-query Update in a single call frame."""
+    return _construct(
+        Update,
+        update_id=next(UpdateFactory._update_id_iter),
+        callback_query=CallbackQueryFactory.create(
+            data=data,
+            from_user=from_user,
+            message=message,
+        ),
+    )
 
 
+@lru_cache(maxsize=1024)
+def _inline_button(text: str, callback_data: str) -> InlineKeyboardButton:
+    """Build an inline button, cached since grids often repeat buttons."""
+    return _construct(InlineKeyboardButton, text=text, callback_data=callback_data)
+
+
+@_resettable
 class KeyboardFactory:
     """Factory for creating mock keyboard markups."""
 
@@ -829,13 +1037,15 @@ class KeyboardFactory:
                 [("Button 3", "cb_3")],
             ])
         """
-        keyboard = []
-        for row in buttons:
-            keyboard_row = []
-            for text, callback_data in row:
-                keyboard_row.append(
-                    InlineKeyboardButton(text=text, callback_data=callback_data)
-                )
-            keyboard.append(keyboard_row)
-
-        return InlineKeyboardMarkup(inline_keyboard=keyboard)
+        return _construct(
+            InlineKeyboardMarkup,
+            inline_keyboard=[
+                [_inline_button(text, callback_data) for text, callback_data in row]
+                for row in buttons
+            ]
+        )
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the cached inline buttons."""
+        _inline_button.cache_clear()
@@ -2,17 +2,47 @@
 Mock Bot implementation that captures all API requests.
 """
 
+import itertools
+import random
+import sys
+from collections import deque
+from dataclasses import replace
+from functools import lru_cache
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Callable, Mapping, Optional
 
 from aiogram import Bot
 from aiogram.client.session.base import BaseSession
 from aiogram.methods import TelegramMethod
 from aiogram.methods.base import TelegramType
-from aiogram.types import Chat, Message, User
+from aiogram.types import (
+    Chat,
+    ChatMemberMember,
+    Dice,
+    Message,
+    PhotoSize,
+    User,
+)
 
 from aiogram_test_framework.request_capture import RequestCapture
-from aiogram_test_framework.types import CapturedRequest, RequestType
+from aiogram_test_framework.types import (
+    CapturedRequest,
+    LazyParams,
+    RequestType,
+    _METHOD_TO_TYPE,
+)
+
+# Bound once so the hot dice path skips the module attribute lookup.
+_randint = random.randint
+
+# Upper dice bounds per emoji; everything else rolls 1-6.
+_DICE_RANGES: dict[str, int] = {"🏀": 5, "⚽": 5, "🎰": 64}
+
+
+@lru_cache(maxsize=1024)
+def _chat_private(chat_id: int) -> Chat:
+    """Build a private Chat for responses, cached per chat id."""
+    return Chat(id=chat_id, type="private")
 
 
 class MockSession(BaseSession):
@@ -23,15 +53,50 @@ class MockSession(BaseSession):
     def __init__(self, capture: RequestCapture, bot_user: User) -> None:
         super().__init__()
         self._capture = capture
-        self._message_id_counter = 1
+        # itertools.count keeps the message-id increment in C;
+        # _get_next_message_id is its bound __next__.
+        self._msg_counter = itertools.count(1)
+        self._get_next_message_id = self._msg_counter.__next__
         self._bot_user: User = bot_user
-        self._next_dice_values: list[int] = []
+        self._next_dice_values: deque[int] = deque()
+        # O(1) dispatch table for mock responses; unknown methods fall
+        # back to True in _generate_response.
+        self._handlers: dict[str, Callable[[Mapping[str, Any], datetime], Any]] = {
+            "sendMessage": self._r_send_message,
+            "editMessageText": self._r_send_message,
+            "sendDice": self._r_send_dice,
+            "sendPhoto": self._r_send_photo,
+            "getChatMember": self._r_get_chat_member,
+            "getChat": self._r_get_chat,
+        }
+        # Precomputed captures for methods whose responses are constant
+        # (success flags, the bot user): make_request clones these with
+        # dataclasses.replace instead of dispatching to a handler.
+        self._templates: dict[str, CapturedRequest] = {
+            "deleteMessage": CapturedRequest(
+                request_type=RequestType.DELETE_MESSAGE, params={}, response=True
+            ),
+            "answerCallbackQuery": CapturedRequest(
+                request_type=RequestType.ANSWER_CALLBACK_QUERY, params={}, response=True
+            ),
+            "getMe": CapturedRequest(
+                request_type=RequestType.GET_ME, params={}, response=bot_user
+            ),
+        }
+        # Bound once so make_request skips the attribute-chain lookups
+        # on every call.
+        self._capture_add = capture.add
+        self._handler_for = self._handlers.get
+        self._template_for = self._templates.get
+
+    def reset_message_counter(self) -> None:
+        """Restart message IDs from 1."""
+        self.set_message_counter(1)
 
-    def _get_next_message_id(self) -> int:
-        """Get the next message ID for responses."""
-        msg_id = self._message_id_counter
-        self._message_id_counter += 1
-        return msg_id
+    def set_message_counter(self, next_id: int) -> None:
+        """Make the next generated message use ``next_id``."""
+        self._msg_counter = itertools.count(next_id)
+        self._get_next_message_id = self._msg_counter.__next__
 
     def set_next_dice_value(self, value: int) -> None:
         """
@@ -45,30 +110,32 @@ class MockSession(BaseSession):
         """
         self._next_dice_values.append(value)
 
+    def set_next_dice_values(self, *values: int) -> None:
+        """
+        Queue several dice values in one call.
+
+        Equivalent to calling set_next_dice_value() for each value in
+        order; they are consumed FIFO by subsequent sendDice calls.
+
+        Args:
+            *values: Dice values to queue.
+        """
+        self._next_dice_values.extend(values)
+
     def _get_next_dice_value(self, emoji: str) -> int:
         """Get the next dice value, or random based on emoji type."""
-        import random
-
         if self._next_dice_values:
-            return self._next_dice_values.pop(0)
+            return self._next_dice_values.popleft()
 
-        # Random value based on emoji type
+        # Random value based on emoji type:
         # 🎲 (dice), 🎯 (darts), 🎳 (bowling): 1-6
         # 🏀 (basketball), ⚽ (football/soccer): 1-5
         # 🎰 (slot machine): 1-64
-        if emoji in ("🏀", "⚽"):
-            return random.randint(1, 5)
-        elif emoji == "🎰":
-            return random.randint(1, 64)
-        else:  # 🎲, 🎯, 🎳 and others
-            return random.randint(1, 6)
-
-    def _method_to_request_type(self, method_name: str) -> RequestType:
-        """Convert method name to RequestType enum."""
-        try:
-            return RequestType(method_name)
-        except ValueError:
-            return RequestType.OTHER
+        return _randint(1, _DICE_RANGES.get(emoji, 6))
+
+    def _method_to_request_type(self, method_name: str) -> str:
+        """Convert method name to a RequestType value."""
+        return _METHOD_TO_TYPE.get(method_name, RequestType.OTHER)
 
     async def make_request(
             self,
@@ -76,25 +143,50 @@ class MockSession(BaseSession):
             method: TelegramMethod[TelegramType],
             timeout: Optional[int] = None,
     ) -> TelegramType:
-        """Intercept API request and generate mock response."""
-        method_name = method.__api_method__
-        params = method.model_dump(exclude_none=True)
+        """
+        Intercept API request and generate mock response.
+
+        Templated methods (deleteMessage, answerCallbackQuery, getMe)
+        return the very same response object every call — getMe yields
+        the session's bot_user instance, not a copy — so callers may
+        rely on identity.
+        """
+        # Interned to match the dispatch-dict keys by identity.
+        method_name = sys.intern(method.__api_method__)
+        # Dumping the method model is deferred until params are first read.
+        params = LazyParams(method)
+
+        template = self._template_for(method_name)
+        if template is not None:
+            if self._capture.enabled:
+                self._capture_add(
+                    # replace() re-runs the non-init field factories, so
+                    # the copy gets its own capture tick without a
+                    # datetime.now() call on this fast path.
+                    replace(template, params=params)
+                )
+            return template.response
 
         request_type = self._method_to_request_type(method_name)
 
+        # One clock read per request for the response's Message.date;
+        # the capture stamps itself with a cheap time.time_ns() tick.
+        now = datetime.now()
+
         response = self._generate_response(
             bot=bot,
             method_name=method_name,
             params=params,
+            now=now,
         )
 
-        captured = CapturedRequest(
-            request_type=request_type,
-            params=params,
-            timestamp=datetime.now(),
-            response=response,
-        )
-        self._capture.add(captured)
+        if self._capture.enabled:
+            captured = CapturedRequest(
+                request_type=request_type,
+                params=params,
+                response=response,
+            )
+            self._capture_add(captured)
 
         return response
 
@@ -102,69 +194,62 @@ class MockSession(BaseSession):
             self,
             bot: Bot,
             method_name: str,
-            params: dict[str, Any],
+            params: Mapping[str, Any],
+            now: datetime,
     ) -> Any:
         """Generate a mock response for the given method."""
-        if method_name == "getMe":
-            return self._bot_user
-
-        if method_name in ("sendMessage", "editMessageText"):
-            chat_id = params.get("chat_id", 0)
-            return Message(
-                message_id=self._get_next_message_id(),
-                date=datetime.now(),
-                chat=Chat(id=chat_id, type="private"),
-                text=params.get("text", ""),
-                from_user=self._bot_user,
-            )
-
-        if method_name == "deleteMessage":
-            return True
-
-        if method_name == "answerCallbackQuery":
-            return True
-
-        if method_name == "sendDice":
-            chat_id = params.get("chat_id", 0)
-            emoji = params.get("emoji", "🎲")
-            from aiogram.types import Dice
-            return Message(
-                message_id=self._get_next_message_id(),
-                date=datetime.now(),
-                chat=Chat(id=chat_id, type="private"),
-                dice=Dice(emoji=emoji, value=self._get_next_dice_value(emoji)),
-                from_user=self._bot_user,
-            )
+        handler = self._handler_for(method_name)
+        return handler(params, now) if handler is not None else True
+
+    def _r_send_message(self, params: Mapping[str, Any], now: datetime) -> Message:
+        """Respond to sendMessage / editMessageText."""
+        chat = _chat_private(params.get("chat_id", 0))
+        text = params.get("text", "")
+        return Message(
+            message_id=self._get_next_message_id(),
+            date=now,
+            chat=chat,
+            text=text,
+            from_user=self._bot_user,
+        )
 
-        if method_name == "sendPhoto":
-            chat_id = params.get("chat_id", 0)
-            from aiogram.types import PhotoSize
-            return Message(
-                message_id=self._get_next_message_id(),
-                date=datetime.now(),
-                chat=Chat(id=chat_id, type="private"),
-                photo=[PhotoSize(file_id="test", file_unique_id="test", width=100, height=100)],
-                caption=params.get("caption"),
-                from_user=self._bot_user,
-            )
+    def _r_send_dice(self, params: Mapping[str, Any], now: datetime) -> Message:
+        """Respond to sendDice."""
+        chat = _chat_private(params.get("chat_id", 0))
+        emoji = params.get("emoji", "🎲")
+        return Message(
+            message_id=self._get_next_message_id(),
+            date=now,
+            chat=chat,
+            dice=Dice(emoji=emoji, value=self._get_next_dice_value(emoji)),
+            from_user=self._bot_user,
+        )
 
-        if method_name == "getChatMember":
-            from aiogram.types import ChatMemberMember
-            return ChatMemberMember(
-                user=User(
-                    id=params.get("user_id", 1),
-                    is_bot=False,
-                    first_name="TestUser",
-                ),
-            )
+    def _r_send_photo(self, params: Mapping[str, Any], now: datetime) -> Message:
+        """Respond to sendPhoto."""
+        chat = _chat_private(params.get("chat_id", 0))
+        return Message(
+            message_id=self._get_next_message_id(),
+            date=now,
+            chat=chat,
+            photo=[PhotoSize(file_id="test", file_unique_id="test", width=100, height=100)],
+            caption=params.get("caption"),
+            from_user=self._bot_user,
+        )
 
-        if method_name == "getChat":
-            return Chat(
-                id=params.get("chat_id", 0),
-                type="private",
-            )
+    def _r_get_chat_member(self, params: Mapping[str, Any], now: datetime) -> ChatMemberMember:
+        """Respond to getChatMember."""
+        return ChatMemberMember(
+            user=User(
+                id=params.get("user_id", 1),
+                is_bot=False,
+                first_name="TestUser",
+            ),
+        )
 
-        return True
+    def _r_get_chat(self, params: Mapping[str, Any], now: datetime) -> Chat:
+        """Respond to getChat."""
+        return _chat_private(params.get("chat_id", 0))
 
     async def stream_content(
             self,
@@ -244,7 +329,11 @@ class MockBot(Bot):
 
     def reset_message_counter(self) -> None:
         """Reset the message ID counter."""
-        self._mock_session._message_id_counter = 1
+        self._mock_session.reset_message_counter()
+
+    def set_message_counter(self, next_id: int) -> None:
+        """Make the next generated message use ``next_id``."""
+        self._mock_session.set_message_counter(next_id)
 
     def set_next_dice_value(self, value: int) -> None:
         """
@@ -258,3 +347,12 @@ class MockBot(Bot):
                    other emoji types like bowling, darts, etc.)
         """
         self._mock_session.set_next_dice_value(value)
+
+    def set_next_dice_values(self, *values: int) -> None:
+        """
+        Queue several dice values for upcoming sendDice calls.
+
+        Args:
+            *values: Dice values to queue, consumed in FIFO order.
+        """
+        self._mock_session.set_next_dice_values(*values)
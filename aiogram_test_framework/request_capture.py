@@ -2,9 +2,67 @@
 Request capture system for tracking all bot API calls.
 """
 
-from typing import Optional
+from collections import defaultdict
+from typing import Optional, Sequence, Union, overload
 
-from aiogram_test_framework.types import CapturedRequest, RequestType
+from aiogram_test_framework.types import (
+    _K_CHAT_ID,
+    _K_TEXT,
+    CapturedRequest,
+    RequestType,
+)
+
+
+class _CaptureView(Sequence[CapturedRequest]):
+    """
+    Lazy, zero-copy view of requests captured between two indexes.
+
+    Indexes into the capture's internal list directly, so checking
+    ``len(result)`` or ``result[0]`` never materializes a copy. With
+    ``stop=None`` the view is open-ended and reflects requests added
+    later; with a stop index it is a fixed snapshot of one range.
+    """
+
+    __slots__ = ("_requests", "_start", "_stop")
+
+    def __init__(
+        self,
+        requests: list[CapturedRequest],
+        start: int,
+        stop: Optional[int] = None,
+    ) -> None:
+        self._requests = requests
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        # Clamped: clear() may shrink the underlying list below the
+        # view's start index, and a held view must then be empty, not
+        # raise from a negative length.
+        stop = len(self._requests)
+        if self._stop is not None and self._stop < stop:
+            stop = self._stop
+        return max(0, stop - self._start)
+
+    @overload
+    def __getitem__(self, index: int) -> CapturedRequest: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[CapturedRequest]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[CapturedRequest, list[CapturedRequest]]:
+        if isinstance(index, slice):
+            return self._requests[self._start:self._stop][index]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("view index out of range")
+        return self._requests[self._start + index]
+
+    def __repr__(self) -> str:
+        return f"_CaptureView({list(self)!r})"
 
 
 class RequestCapture:
@@ -19,53 +77,122 @@ class RequestCapture:
         assert "Welcome" in messages[0].text
     """
 
-    def __init__(self) -> None:
+    def __init__(self, enabled: bool = True) -> None:
+        # When disabled, add() is a no-op and MockSession skips building
+        # CapturedRequest objects entirely — useful for stress tests
+        # that only care about handler-side behavior.
+        self.enabled = enabled
         self._requests: list[CapturedRequest] = []
+        # Indexes kept in sync by add() so type/chat queries are O(1)
+        # instead of rescanning the whole request list per assertion.
+        self._by_type: defaultdict[str, list[CapturedRequest]] = (
+            defaultdict(list)
+        )
+        # The per-chat index is built lazily in _get_by_type_and_chat:
+        # reading chat_id forces the params dump, which add() must avoid
+        # for requests whose params are never inspected.
+        self._by_type_chat: defaultdict[
+            tuple[str, Optional[int]], list[CapturedRequest]
+        ] = defaultdict(list)
+        self._chat_indexed: defaultdict[str, int] = defaultdict(int)
+        # Plain text lists so has_message_containing scans strings with
+        # C-level substring search instead of chasing request attributes.
+        # Safe to fill eagerly: the sendMessage handler has already read
+        # the params, so the lazy dump is cached by the time add() runs.
+        self._texts_all: list[str] = []
+        self._texts_by_chat: defaultdict[Optional[int], list[str]] = (
+            defaultdict(list)
+        )
 
     def add(self, request: CapturedRequest) -> None:
         """Add a captured request to the list."""
+        if not self.enabled:
+            return
         self._requests.append(request)
+        self._by_type[request.request_type].append(request)
+        if request.request_type == RequestType.SEND_MESSAGE:
+            text = request.params.get(_K_TEXT)
+            if text:
+                self._texts_all.append(text)
+                self._texts_by_chat[request.params.get(_K_CHAT_ID)].append(text)
 
     def clear(self) -> None:
         """Clear all captured requests."""
         self._requests.clear()
+        self._by_type.clear()
+        self._by_type_chat.clear()
+        self._chat_indexed.clear()
+        self._texts_all.clear()
+        self._texts_by_chat.clear()
 
     @property
     def all_requests(self) -> list[CapturedRequest]:
-        """Get all captured requests."""
-        return list(self._requests)
+        """Get all captured requests (do not mutate the result)."""
+        return self._requests
+
+    def since(self, index: int) -> list[CapturedRequest]:
+        """
+        Get requests captured from the given index onward.
 
-    def get_by_type(self, request_type: RequestType) -> list[CapturedRequest]:
-        """Get all requests of a specific type."""
-        return [r for r in self._requests if r.request_type == request_type]
+        Slices the internal list directly, so only the tail is copied.
+        """
+        return self._requests[index:]
+
+    def mark(self) -> int:
+        """Get a marker for the current capture position (see view())."""
+        return len(self._requests)
+
+    def view(
+        self,
+        start: int,
+        stop: Optional[int] = None,
+    ) -> Sequence[CapturedRequest]:
+        """
+        Get a zero-copy view of requests captured from start onward.
+
+        Unlike since(), nothing is copied: the view reads the internal
+        list lazily. With stop=None it also reflects requests added
+        later; pass a stop mark to get a fixed snapshot of one range.
+        """
+        return _CaptureView(self._requests, start, stop)
+
+    def get_by_type(self, request_type: str) -> list[CapturedRequest]:
+        """Get all requests of a specific type (do not mutate the result)."""
+        return self._by_type.get(request_type, [])
+
+    def _get_by_type_and_chat(
+        self,
+        request_type: str,
+        chat_id: Optional[int],
+    ) -> list[CapturedRequest]:
+        """Get requests of a type, optionally narrowed to one chat."""
+        if chat_id is None:
+            return self._by_type.get(request_type, [])
+        # Extend the per-chat index with requests captured since the
+        # last query of this type.
+        bucket = self._by_type.get(request_type, [])
+        start = self._chat_indexed[request_type]
+        for i in range(start, len(bucket)):
+            request = bucket[i]
+            self._by_type_chat[(request_type, request.chat_id)].append(request)
+        self._chat_indexed[request_type] = len(bucket)
+        return self._by_type_chat.get((request_type, chat_id), [])
 
     def get_sent_messages(self, chat_id: Optional[int] = None) -> list[CapturedRequest]:
         """Get all sendMessage requests, optionally filtered by chat_id."""
-        messages = self.get_by_type(RequestType.SEND_MESSAGE)
-        if chat_id is not None:
-            messages = [m for m in messages if m.chat_id == chat_id]
-        return messages
+        return self._get_by_type_and_chat(RequestType.SEND_MESSAGE, chat_id)
 
     def get_edited_messages(self, chat_id: Optional[int] = None) -> list[CapturedRequest]:
         """Get all editMessageText requests, optionally filtered by chat_id."""
-        messages = self.get_by_type(RequestType.EDIT_MESSAGE_TEXT)
-        if chat_id is not None:
-            messages = [m for m in messages if m.chat_id == chat_id]
-        return messages
+        return self._get_by_type_and_chat(RequestType.EDIT_MESSAGE_TEXT, chat_id)
 
     def get_edited_reply_markups(self, chat_id: Optional[int] = None) -> list[CapturedRequest]:
         """Get all editMessageReplyMarkup requests, optionally filtered by chat_id."""
-        messages = self.get_by_type(RequestType.EDIT_MESSAGE_REPLY_MARKUP)
-        if chat_id is not None:
-            messages = [m for m in messages if m.chat_id == chat_id]
-        return messages
+        return self._get_by_type_and_chat(RequestType.EDIT_MESSAGE_REPLY_MARKUP, chat_id)
 
     def get_deleted_messages(self, chat_id: Optional[int] = None) -> list[CapturedRequest]:
         """Get all deleteMessage requests, optionally filtered by chat_id."""
-        messages = self.get_by_type(RequestType.DELETE_MESSAGE)
-        if chat_id is not None:
-            messages = [m for m in messages if m.chat_id == chat_id]
-        return messages
+        return self._get_by_type_and_chat(RequestType.DELETE_MESSAGE, chat_id)
 
     def get_callback_answers(self) -> list[CapturedRequest]:
         """Get all answerCallbackQuery requests."""
@@ -73,15 +200,19 @@ class RequestCapture:
 
     def get_dice_sends(self, chat_id: Optional[int] = None) -> list[CapturedRequest]:
         """Get all sendDice requests, optionally filtered by chat_id."""
-        messages = self.get_by_type(RequestType.SEND_DICE)
-        if chat_id is not None:
-            messages = [m for m in messages if m.chat_id == chat_id]
-        return messages
+        return self._get_by_type_and_chat(RequestType.SEND_DICE, chat_id)
 
     def get_last_message(self, chat_id: Optional[int] = None) -> Optional[CapturedRequest]:
         """Get the last sent message, optionally filtered by chat_id."""
-        messages = self.get_sent_messages(chat_id=chat_id)
-        return messages[-1] if messages else None
+        bucket = self._by_type.get(RequestType.SEND_MESSAGE, ())
+        if chat_id is None:
+            return bucket[-1] if bucket else None
+        # Walk the bucket from the tail: the match is usually the most
+        # recent request, and this skips extending the per-chat index.
+        for request in reversed(bucket):
+            if request.chat_id == chat_id:
+                return request
+        return None
 
     def get_last_request(self) -> Optional[CapturedRequest]:
         """Get the last request of any type."""
@@ -91,16 +222,24 @@ class RequestCapture:
         self,
         text: str,
         chat_id: Optional[int] = None,
+        case_insensitive: bool = False,
     ) -> bool:
         """Check if any sent message contains the given text."""
-        for message in self.get_sent_messages(chat_id=chat_id):
-            if message.text and text in message.text:
-                return True
-        return False
-
-    def count_by_type(self, request_type: RequestType) -> int:
+        if chat_id is None:
+            texts = self._texts_all
+        else:
+            texts = self._texts_by_chat.get(chat_id, [])
+        if case_insensitive:
+            # The needle is lowered once, outside the loop; message
+            # texts are lowered only when this flag is used, so the
+            # common exact-match path pays nothing for it.
+            needle = text.lower()
+            return any(needle in t.lower() for t in texts)
+        return any(text in t for t in texts)
+
+    def count_by_type(self, request_type: str) -> int:
         """Count requests of a specific type."""
-        return len(self.get_by_type(request_type))
+        return len(self._by_type.get(request_type, ()))
 
     def __len__(self) -> int:
         """Get the total number of captured requests."""
@@ -2,94 +2,207 @@
 Type definitions for the testing framework.
 """
 
+import sys
+import time
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
-from typing import Any, Optional
+from typing import Any, Final, Iterator, Optional
 
 
-class RequestType(str, Enum):
-    """Types of Telegram Bot API requests."""
+class RequestType:
+    """
+    Types of Telegram Bot API requests.
+
+    Plain interned string constants rather than an Enum: the values are
+    used as hot dict keys and compare keys, and interned strings hit
+    CPython's pointer-equality fast path without Enum descriptor
+    overhead.
+    """
 
     # Messages
-    SEND_MESSAGE = "sendMessage"
-    EDIT_MESSAGE_TEXT = "editMessageText"
-    EDIT_MESSAGE_REPLY_MARKUP = "editMessageReplyMarkup"
-    DELETE_MESSAGE = "deleteMessage"
-    FORWARD_MESSAGE = "forwardMessage"
-    COPY_MESSAGE = "copyMessage"
+    SEND_MESSAGE: Final[str] = sys.intern("sendMessage")
+    EDIT_MESSAGE_TEXT: Final[str] = sys.intern("editMessageText")
+    EDIT_MESSAGE_REPLY_MARKUP: Final[str] = sys.intern("editMessageReplyMarkup")
+    DELETE_MESSAGE: Final[str] = sys.intern("deleteMessage")
+    FORWARD_MESSAGE: Final[str] = sys.intern("forwardMessage")
+    COPY_MESSAGE: Final[str] = sys.intern("copyMessage")
 
     # Media
-    SEND_PHOTO = "sendPhoto"
-    SEND_VIDEO = "sendVideo"
-    SEND_AUDIO = "sendAudio"
-    SEND_DOCUMENT = "sendDocument"
-    SEND_STICKER = "sendSticker"
-    SEND_ANIMATION = "sendAnimation"
-    SEND_VOICE = "sendVoice"
-    SEND_VIDEO_NOTE = "sendVideoNote"
-    SEND_MEDIA_GROUP = "sendMediaGroup"
+    SEND_PHOTO: Final[str] = sys.intern("sendPhoto")
+    SEND_VIDEO: Final[str] = sys.intern("sendVideo")
+    SEND_AUDIO: Final[str] = sys.intern("sendAudio")
+    SEND_DOCUMENT: Final[str] = sys.intern("sendDocument")
+    SEND_STICKER: Final[str] = sys.intern("sendSticker")
+    SEND_ANIMATION: Final[str] = sys.intern("sendAnimation")
+    SEND_VOICE: Final[str] = sys.intern("sendVoice")
+    SEND_VIDEO_NOTE: Final[str] = sys.intern("sendVideoNote")
+    SEND_MEDIA_GROUP: Final[str] = sys.intern("sendMediaGroup")
 
     # Special
-    SEND_DICE = "sendDice"
-    SEND_LOCATION = "sendLocation"
-    SEND_CONTACT = "sendContact"
-    SEND_POLL = "sendPoll"
+    SEND_DICE: Final[str] = sys.intern("sendDice")
+    SEND_LOCATION: Final[str] = sys.intern("sendLocation")
+    SEND_CONTACT: Final[str] = sys.intern("sendContact")
+    SEND_POLL: Final[str] = sys.intern("sendPoll")
 
     # Chat actions
-    SEND_CHAT_ACTION = "sendChatAction"
+    SEND_CHAT_ACTION: Final[str] = sys.intern("sendChatAction")
 
     # Callbacks
-    ANSWER_CALLBACK_QUERY = "answerCallbackQuery"
-    ANSWER_INLINE_QUERY = "answerInlineQuery"
+    ANSWER_CALLBACK_QUERY: Final[str] = sys.intern("answerCallbackQuery")
+    ANSWER_INLINE_QUERY: Final[str] = sys.intern("answerInlineQuery")
 
     # Chat management
-    GET_CHAT = "getChat"
-    GET_CHAT_MEMBER = "getChatMember"
-    BAN_CHAT_MEMBER = "banChatMember"
-    UNBAN_CHAT_MEMBER = "unbanChatMember"
-    RESTRICT_CHAT_MEMBER = "restrictChatMember"
+    GET_CHAT: Final[str] = sys.intern("getChat")
+    GET_CHAT_MEMBER: Final[str] = sys.intern("getChatMember")
+    BAN_CHAT_MEMBER: Final[str] = sys.intern("banChatMember")
+    UNBAN_CHAT_MEMBER: Final[str] = sys.intern("unbanChatMember")
+    RESTRICT_CHAT_MEMBER: Final[str] = sys.intern("restrictChatMember")
 
     # Bot info
-    GET_ME = "getMe"
-    GET_MY_COMMANDS = "getMyCommands"
-    SET_MY_COMMANDS = "setMyCommands"
+    GET_ME: Final[str] = sys.intern("getMe")
+    GET_MY_COMMANDS: Final[str] = sys.intern("getMyCommands")
+    SET_MY_COMMANDS: Final[str] = sys.intern("setMyCommands")
 
     # Other
-    OTHER = "other"
+    OTHER: Final[str] = sys.intern("other")
+
+    @classmethod
+    def values(cls) -> tuple[str, ...]:
+        """Get all known request-type values."""
+        return tuple(
+            value
+            for name, value in vars(cls).items()
+            if not name.startswith("_") and isinstance(value, str)
+        )
+
+
+# Maps API method names to their RequestType value without the
+# exception cost of a constructor call for unknown methods. Since the
+# values are the method names themselves, this doubles as the set of
+# known methods; keys are interned so lookups hit CPython's
+# string-identity fast path.
+_METHOD_TO_TYPE: dict[str, str] = {value: value for value in RequestType.values()}
+
+
+class LazyParams(Mapping):
+    """
+    Mapping over a Telegram method's params, dumped lazily.
+
+    Defers method.model_dump(exclude_none=True) — a full Pydantic model
+    walk — until the params are first inspected, so captured requests
+    whose params are never read skip the dump entirely.
+    """
+
+    __slots__ = ("_method", "_cached")
+
+    def __init__(self, method: Any) -> None:
+        self._method = method
+        self._cached: Optional[dict[str, Any]] = None
+
+    def _dump(self) -> dict[str, Any]:
+        if self._cached is None:
+            self._cached = self._method.model_dump(exclude_none=True)
+        return self._cached
 
+    def __getitem__(self, key: str) -> Any:
+        return self._dump()[key]
 
-@dataclass
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._dump())
+
+    def __len__(self) -> int:
+        return len(self._dump())
+
+    def __repr__(self) -> str:
+        return repr(self._dump())
+
+
+# Interned params keys: guarantees the lookups below hit the dict's
+# identity fast path even when the params mapping was built with
+# non-interned keys.
+_K_CHAT_ID: Final[str] = sys.intern("chat_id")
+_K_TEXT: Final[str] = sys.intern("text")
+_K_MESSAGE_ID: Final[str] = sys.intern("message_id")
+_K_REPLY_MARKUP: Final[str] = sys.intern("reply_markup")
+
+# Sentinel distinguishing "not looked up yet" from a params value of
+# None in the CapturedRequest caches below.
+_UNSET: Final[Any] = object()
+
+
+@dataclass(slots=True)
 class CapturedRequest:
     """A captured request made by the bot to Telegram API."""
 
-    request_type: RequestType
-    params: dict[str, Any]
-    timestamp: datetime = field(default_factory=datetime.now)
+    request_type: str
+    params: Mapping[str, Any]
     response: Optional[Any] = None
+    # Capture time as a raw nanosecond tick: time.time_ns() is far
+    # cheaper than datetime.now(), and most captures never have their
+    # timestamp read. The datetime is materialized lazily below.
+    _ts_ns: int = field(default_factory=time.time_ns, init=False, repr=False, compare=False)
+    _timestamp: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    # Per-field caches: the properties below are hammered by the capture
+    # filters, so each params lookup happens at most once per instance.
+    # Filled lazily rather than in __post_init__ so constructing a
+    # request never forces the LazyParams dump.
+    _chat_id: Any = field(default=_UNSET, init=False, repr=False, compare=False)
+    _text: Any = field(default=_UNSET, init=False, repr=False, compare=False)
+    _message_id: Any = field(default=_UNSET, init=False, repr=False, compare=False)
+    _reply_markup: Any = field(default=_UNSET, init=False, repr=False, compare=False)
+    _repr: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Get the wall-clock time the request was captured at."""
+        if self._timestamp is None:
+            # Integer math keeps microsecond rounding consistent with
+            # datetime.now(); float division would lose precision.
+            seconds, microseconds = divmod((self._ts_ns + 500) // 1000, 1_000_000)
+            self._timestamp = datetime.fromtimestamp(seconds).replace(
+                microsecond=microseconds
+            )
+        return self._timestamp
 
     @property
     def chat_id(self) -> Optional[int]:
         """Get the chat_id from the request params if present."""
-        return self.params.get("chat_id")
+        if self._chat_id is _UNSET:
+            self._chat_id = self.params.get(_K_CHAT_ID)
+        return self._chat_id
 
     @property
     def text(self) -> Optional[str]:
         """Get the text from the request params if present."""
-        return self.params.get("text")
+        if self._text is _UNSET:
+            self._text = self.params.get(_K_TEXT)
+        return self._text
 
     @property
     def message_id(self) -> Optional[int]:
         """Get the message_id from the request params if present."""
-        return self.params.get("message_id")
+        if self._message_id is _UNSET:
+            self._message_id = self.params.get(_K_MESSAGE_ID)
+        return self._message_id
 
     @property
     def reply_markup(self) -> Optional[Any]:
         """Get the reply_markup from the request params if present."""
-        return self.params.get("reply_markup")
+        if self._reply_markup is _UNSET:
+            self._reply_markup = self.params.get(_K_REPLY_MARKUP)
+        return self._reply_markup
 
     def __repr__(self) -> str:
-        text_preview = ""
-        if self.text:
-            text_preview = f", text={self.text[:50]!r}..."
-        return f"CapturedRequest({self.request_type.value}, chat_id={self.chat_id}{text_preview})"
+        # Requests are effectively immutable after construction, so the
+        # string is built once; pytest re-reprs captures heavily when
+        # rendering assertion failures.
+        if self._repr is None:
+            text_preview = ""
+            if self.text:
+                text_preview = f", text={self.text[:50]!r}..."
+            self._repr = (
+                f"CapturedRequest({self.request_type},"
+                f" chat_id={self.chat_id}{text_preview})"
+            )
+        return self._repr
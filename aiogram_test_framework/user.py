@@ -2,7 +2,7 @@
 Test user for simulating Telegram user interactions with the bot.
 """
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Sequence
 
 from aiogram.types import Chat, Message, User
 
@@ -54,7 +54,7 @@ class TestUser:
         """Change the client for this user."""
         self._client = client
 
-    async def send_message(self, text: str) -> list[CapturedRequest]:
+    async def send_message(self, text: str) -> Sequence[CapturedRequest]:
         """
         Send a text message to the bot and return captured responses.
 
@@ -70,11 +70,26 @@ class TestUser:
             chat=self._chat,
         )
 
+    async def send_messages(
+        self,
+        texts: Sequence[str],
+    ) -> list[Sequence[CapturedRequest]]:
+        """
+        Send several text messages in order and collect the responses.
+
+        Args:
+            texts: Message texts, sent one after another
+
+        Returns:
+            One list of captured responses per sent message, in order
+        """
+        return [await self.send_message(text) for text in texts]
+
     async def send_command(
         self,
         command: str,
         args: Optional[str] = None,
-    ) -> list[CapturedRequest]:
+    ) -> Sequence[CapturedRequest]:
         """
         Send a command to the bot (e.g., /start, /help).
 
@@ -96,7 +111,7 @@ class TestUser:
         self,
         callback_data: str,
         message: Optional[Message] = None,
-    ) -> list[CapturedRequest]:
+    ) -> Sequence[CapturedRequest]:
         """
         Simulate clicking an inline keyboard button.
 
@@ -117,7 +132,7 @@ class TestUser:
         self,
         value: Optional[int] = None,
         emoji: str = "🎲",
-    ) -> list[CapturedRequest]:
+    ) -> Sequence[CapturedRequest]:
         """
         Send a dice message to the bot.
 
@@ -139,7 +154,7 @@ class TestUser:
         self,
         text: str,
         forward_from: User,
-    ) -> list[CapturedRequest]:
+    ) -> Sequence[CapturedRequest]:
         """
         Send a forwarded message from another user.
 
@@ -161,7 +176,7 @@ class TestUser:
         self,
         text: str,
         sender_user_name: str,
-    ) -> list[CapturedRequest]:
+    ) -> Sequence[CapturedRequest]:
         """
         Send a forwarded message from a hidden user.
 
@@ -184,7 +199,7 @@ class TestUser:
         text: str,
         sender_chat: Chat,
         author_signature: Optional[str] = None,
-    ) -> list[CapturedRequest]:
+    ) -> Sequence[CapturedRequest]:
         """
         Send a forwarded message from a chat.
 
@@ -210,7 +225,7 @@ class TestUser:
         channel_chat: Chat,
         channel_message_id: int,
         author_signature: Optional[str] = None,
-    ) -> list[CapturedRequest]:
+    ) -> Sequence[CapturedRequest]:
         """
         Send a forwarded message from a channel.
 
@@ -232,7 +247,7 @@ class TestUser:
             author_signature=author_signature,
         )
 
-    def get_sent_messages(self) -> list[CapturedRequest]:
+    def get_sent_messages(self) -> Sequence[CapturedRequest]:
         """Get all messages sent by the bot to this user's chat."""
         return self._client.capture.get_sent_messages(chat_id=self.chat_id)
 
@@ -2,20 +2,29 @@
 Pytest configuration and shared fixtures.
 """
 
+import asyncio
+import sys
+
 import pytest
+import pytest_asyncio
 from aiogram import Bot, Dispatcher, Router
 from aiogram.filters import Command
 from aiogram.types import Message
 
 from aiogram_test_framework import TestClient
-from aiogram_test_framework.factories import (
-    CallbackQueryFactory,
-    MessageFactory,
-    UpdateFactory,
-    UserFactory,
-)
+from aiogram_test_framework.factories import UserFactory, reset_all
 from aiogram_test_framework.request_capture import RequestCapture
 
+# uvloop schedules callbacks noticeably faster than the stock loop;
+# the suite is pure event-loop work, so apply it where available.
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 
 @pytest.fixture
 def capture() -> RequestCapture:
@@ -25,16 +34,33 @@ def capture() -> RequestCapture:
 
 @pytest.fixture(autouse=True)
 def reset_factories():
-    """Reset all factory counters before each test."""
-    UserFactory.reset_counter()
-    MessageFactory.reset_counter()
-    CallbackQueryFactory.reset_counter()
-    UpdateFactory.reset_counter()
+    """Reset all factory state before and after each test.
+
+    Goes through the reset_all() registry rather than per-factory
+    counter resets so caches (e.g. ChatFactory's per-user chat cache)
+    are cleared too — counters restart per test, so a stale cache
+    would alias repeated ids across tests.
+    """
+    reset_all()
     yield
-    UserFactory.reset_counter()
-    MessageFactory.reset_counter()
-    CallbackQueryFactory.reset_counter()
-    UpdateFactory.reset_counter()
+    reset_all()
+
+
+@pytest.fixture
+def default_user():
+    """Provide one user for tests that only need a valid from_user."""
+    return UserFactory.create()
+
+
+@pytest.fixture(scope="session")
+def user_pool():
+    """Preallocate users for tests that only need some valid User.
+
+    Building a User walks the full factory pipeline; tests that don't
+    care about the identity can take ``user_pool[0]`` instead of
+    creating one per test.
+    """
+    return [UserFactory.create() for _ in range(32)]
 
 
 def create_simple_bot_dispatcher(bot: Bot, dispatcher: Dispatcher) -> None:
@@ -62,15 +88,38 @@ def create_simple_bot_dispatcher(bot: Bot, dispatcher: Dispatcher) -> None:
     dispatcher.include_router(router)
 
 
+@pytest_asyncio.fixture(scope="session")
+async def session_client_factory():
+    """
+    Provide a factory yielding one cached TestClient per dispatcher setup.
+
+    Bot/Dispatcher construction dominates trivial tests, so clients are
+    built once per setup function and reused; on a cache hit the client
+    is reset for the next test. All clients are closed at session end.
+    """
+    clients = {}
+
+    async def factory(setup_dispatcher_func=None):
+        client = clients.get(setup_dispatcher_func)
+        if client is None:
+            client = await TestClient.create(
+                bot_token="123456:ABC-DEF",
+                bot_id=123456,
+                bot_username="test_bot",
+                bot_first_name="Test Bot",
+                setup_dispatcher_func=setup_dispatcher_func,
+            )
+            clients[setup_dispatcher_func] = client
+        else:
+            client.reset_for_next_test()
+        return client
+
+    yield factory
+    for client in clients.values():
+        await client.close()
+
+
 @pytest.fixture
-async def simple_client() -> TestClient:
+async def simple_client(session_client_factory) -> TestClient:
     """Provide a TestClient with a simple bot setup."""
-    client = await TestClient.create(
-        bot_token="123456:ABC-DEF",
-        bot_id=123456,
-        bot_username="test_bot",
-        bot_first_name="Test Bot",
-        setup_dispatcher_func=create_simple_bot_dispatcher,
-    )
-    yield client
-    await client.close()
+    return await session_client_factory(create_simple_bot_dispatcher)
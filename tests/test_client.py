@@ -2,49 +2,138 @@
 Tests for TestClient class.
 """
 
+import asyncio
+
 import pytest
-from aiogram import Bot, Dispatcher, Router
+import pytest_asyncio
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from aiogram import Bot, Dispatcher, F, Router
 from aiogram.filters import Command
+from aiogram.fsm.storage.memory import MemoryStorage
 from aiogram.types import Message
 
 from aiogram_test_framework import TestClient
-from aiogram_test_framework.factories import (
-    CallbackQueryFactory,
-    ChatFactory,
-    MessageFactory,
-    UpdateFactory,
-    UserFactory,
-)
+from aiogram_test_framework.factories import ChatFactory, UserFactory
 from aiogram_test_framework.mock_bot import MockBot
 from aiogram_test_framework.request_capture import RequestCapture
 
 
+# Command filters parse their config at construction, so build them once.
+_CMD_START = Command("start")
+_CMD_ECHO = Command("echo")
+
+
+# Handlers are defined once at module level; the setup functions only
+# register them. A single module-level Router can't be shared because
+# aiogram routers attach to exactly one parent dispatcher.
+async def _start_handler(message: Message) -> None:
+    await message.answer("Welcome!")
+
+
+async def _echo_handler(message: Message) -> None:
+    await message.answer(f"You said: {message.text}")
+
+
+async def _echo_args_handler(message: Message) -> None:
+    text = message.text or ""
+    args = text.split(maxsplit=1)[1] if " " in text else "nothing"
+    await message.answer(f"Args: {args}")
+
+
+async def _callback_handler(callback) -> None:
+    await callback.answer("Received!")
+
+
+_BOT_KW = {
+    "bot_token": "123456:ABC",
+    "bot_id": 123456,
+    "bot_username": "test_bot",
+    "bot_first_name": "Test Bot",
+}
+
 def create_simple_dispatcher(bot: Bot, dispatcher: Dispatcher) -> None:
     """Create a simple dispatcher with basic handlers."""
     router = Router()
+    router.message.register(_start_handler, _CMD_START)
+    router.message.register(_echo_handler)
+    dispatcher.include_router(router)
+
 
-    @router.message(Command("start"))
-    async def start_handler(message: Message) -> None:
-        await message.answer("Welcome!")
+def setup_with_args(bot: Bot, dispatcher: Dispatcher) -> None:
+    """Create a dispatcher with a command handler that echoes its args."""
+    router = Router()
+    router.message.register(_echo_args_handler, _CMD_ECHO)
+    dispatcher.include_router(router)
 
-    @router.message()
-    async def echo_handler(message: Message) -> None:
-        await message.answer(f"You said: {message.text}")
 
+def setup_callback(bot: Bot, dispatcher: Dispatcher) -> None:
+    """Create a dispatcher with a callback-query handler."""
+    router = Router()
+    router.callback_query.register(_callback_handler, F.data == "test")
     dispatcher.include_router(router)
 
 
+# Origins received by the shared forward handler; cleared per test.
+_forward_origins = []
+
+
+async def _forward_handler(message: Message) -> None:
+    _forward_origins.append(message.forward_origin)
+    origin = message.forward_origin
+    await message.answer(
+        f"Forwarded ({type(origin).__name__}): "
+        f"{origin.model_dump_json(exclude_none=True)}"
+    )
+
+
+def setup_forward_handler(bot: Bot, dispatcher: Dispatcher) -> None:
+    """Create a dispatcher with one origin-agnostic forward handler."""
+    router = Router()
+    router.message.register(
+        _forward_handler, lambda m: m.forward_origin is not None
+    )
+    dispatcher.include_router(router)
+
+
+@pytest_asyncio.fixture
+async def client_factory():
+    """Create TestClients that are closed automatically at teardown.
+
+    Centralizes the await client.close() boilerplate and guarantees
+    cleanup even when a test fails before its close call.
+    """
+    clients = []
+
+    async def factory(**kwargs):
+        client = await TestClient.create(**_BOT_KW, **kwargs)
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        await client.close()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def shared_client(session_client_factory):
+    """One TestClient shared by tests that don't need custom handlers."""
+    return await session_client_factory(None)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def shared_client_with_simple_dispatcher(session_client_factory):
+    """One TestClient with the simple echo dispatcher, shared per module."""
+    return await session_client_factory(create_simple_dispatcher)
+
+
+@pytest.mark.xdist_group("shared_client")
 class TestTestClientCreation:
     """Tests for TestClient creation."""
 
-    async def test_create_with_defaults(self):
+    async def test_create_with_defaults(self, shared_client):
         """Test creating a TestClient with default settings."""
-        client = await TestClient.create(
-            bot_token="123456:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
+        client = shared_client
 
         assert isinstance(client.bot, MockBot)
         assert isinstance(client.dispatcher, Dispatcher)
@@ -52,94 +141,50 @@ class TestTestClientCreation:
         assert client.bot.bot_user.id == 123456
         assert client.bot.bot_user.username == "test_bot"
 
-        await client.close()
-
-    async def test_create_with_setup_func(self):
+    async def test_create_with_setup_func(self, client_factory):
         """Test creating a TestClient with setup function."""
         setup_called = []
 
         def setup_func(bot: Bot, dispatcher: Dispatcher) -> None:
             setup_called.append(True)
 
-        client = await TestClient.create(
-            bot_token="123456:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-            setup_dispatcher_func=setup_func,
-        )
+        await client_factory(setup_dispatcher_func=setup_func)
 
         assert len(setup_called) == 1
-        await client.close()
 
-    async def test_create_with_custom_dispatcher(self):
+    async def test_create_with_custom_dispatcher(self, client_factory):
         """Test creating a TestClient with a pre-created dispatcher."""
-        from aiogram.fsm.storage.memory import MemoryStorage
-
         custom_dispatcher = Dispatcher(storage=MemoryStorage())
-        client = await TestClient.create(
-            bot_token="123456:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-            dispatcher=custom_dispatcher,
-        )
+        client = await client_factory(dispatcher=custom_dispatcher)
 
         assert client.dispatcher is custom_dispatcher
-        await client.close()
 
 
+@pytest.mark.xdist_group("shared_client")
 class TestTestClientProperties:
     """Tests for TestClient properties."""
 
-    async def test_dispatcher_property(self):
-        """Test dispatcher property."""
-        client = await TestClient.create(
-            bot_token="123456:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
-        assert isinstance(client.dispatcher, Dispatcher)
-        await client.close()
-
-    async def test_bot_property(self):
-        """Test bot property."""
-        client = await TestClient.create(
-            bot_token="123456:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
-        assert isinstance(client.bot, MockBot)
-        await client.close()
-
-    async def test_capture_property(self):
-        """Test capture property."""
-        client = await TestClient.create(
-            bot_token="123456:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
-        assert isinstance(client.capture, RequestCapture)
-        await client.close()
+    @pytest.mark.parametrize(
+        "attr,expected_type",
+        [
+            ("bot", MockBot),
+            ("dispatcher", Dispatcher),
+            ("capture", RequestCapture),
+        ],
+    )
+    async def test_property(self, shared_client, attr, expected_type):
+        """Test that each public property exposes the right type."""
+        assert isinstance(getattr(shared_client, attr), expected_type)
 
 
+@pytest.mark.xdist_group("shared_client")
 class TestTestClientUserCreation:
     """Tests for TestClient user creation."""
 
-    async def test_create_user_defaults(self):
+    async def test_create_user_defaults(self, shared_client):
         """Test creating a user with defaults."""
-        client = await TestClient.create(
-            bot_token="123456:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
+        client = shared_client
+        client.reset()
 
         user = client.create_user()
 
@@ -148,191 +193,161 @@ class TestTestClientUserCreation:
         assert user.chat.type == "private"
         assert user.user_id == user.chat_id
 
-        await client.close()
-
-    async def test_create_user_custom(self):
-        """Test creating a user with custom values."""
-        client = await TestClient.create(
-            bot_token="123456:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
+    @given(
+        user_id=st.integers(min_value=1, max_value=10_000_000),
+        first_name=st.text(min_size=1, max_size=20),
+    )
+    @settings(max_examples=10, deadline=None)
+    def test_create_user_property(self, shared_client, user_id, first_name):
+        """Test the create_user contract over arbitrary inputs."""
+        user = shared_client.create_user(user_id=user_id, first_name=first_name)
+
+        assert user.user_id == user_id
+        assert user.user.first_name == first_name
+        assert user.user_id == user.chat_id
 
-        user = client.create_user(
+    @given(
+        last_name=st.text(min_size=1, max_size=20),
+        username=st.text(
+            alphabet="abcdefghijklmnopqrstuvwxyz_", min_size=1, max_size=20
+        ),
+    )
+    @settings(max_examples=10, deadline=None)
+    def test_create_user_custom_property(self, shared_client, last_name, username):
+        """Test that optional user fields pass through create_user."""
+        user = shared_client.create_user(
             user_id=999,
             first_name="John",
-            last_name="Doe",
-            username="johndoe",
+            last_name=last_name,
+            username=username,
             language_code="uk",
         )
 
         assert user.user_id == 999
         assert user.user.first_name == "John"
-        assert user.user.last_name == "Doe"
-        assert user.user.username == "johndoe"
+        assert user.user.last_name == last_name
+        assert user.user.username == username
         assert user.user.language_code == "uk"
 
-        await client.close()
-
 
+@pytest.mark.xdist_group("messaging")
 class TestTestClientMessaging:
     """Tests for TestClient messaging."""
 
-    async def test_send_message(self):
+    async def test_send_message(self, shared_client_with_simple_dispatcher, user_pool):
         """Test sending a message."""
-        client = await TestClient.create(
-            bot_token="123456:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-            setup_dispatcher_func=create_simple_dispatcher,
-        )
+        client = shared_client_with_simple_dispatcher
+        client.reset()
 
-        user = UserFactory.create()
+        user = user_pool[0]
         responses = await client.send_message(text="Hello", from_user=user)
 
-        assert len(responses) == 1
-        assert "You said: Hello" in responses[0].text
+        (response,) = responses
+        assert "You said: Hello" in response.text
 
-        await client.close()
+    async def test_send_message_returns_snapshot(
+        self, shared_client_with_simple_dispatcher, user_pool
+    ):
+        """Test that a held result covers only its own send."""
+        client = shared_client_with_simple_dispatcher
+        client.reset()
+
+        user = user_pool[0]
+        first = await client.send_message(text="First", from_user=user)
+        await client.send_message(text="Second", from_user=user)
 
-    async def test_send_command(self):
+        (response,) = first
+        assert "You said: First" in response.text
+
+    async def test_send_command(self, shared_client_with_simple_dispatcher, user_pool):
         """Test sending a command."""
-        client = await TestClient.create(
-            bot_token="123456:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-            setup_dispatcher_func=create_simple_dispatcher,
-        )
+        client = shared_client_with_simple_dispatcher
+        client.reset()
 
-        user = UserFactory.create()
+        user = user_pool[0]
         responses = await client.send_command(command="start", from_user=user)
 
-        assert len(responses) == 1
-        assert responses[0].text == "Welcome!"
-
-        await client.close()
+        (response,) = responses
+        assert response.text == "Welcome!"
 
-    async def test_send_command_with_args(self):
+    async def test_send_command_with_args(self, client_factory, user_pool):
         """Test sending a command with arguments."""
-        def setup_with_args(bot: Bot, dispatcher: Dispatcher) -> None:
-            router = Router()
+        client = await client_factory(setup_dispatcher_func=setup_with_args)
 
-            @router.message(Command("echo"))
-            async def echo_cmd(message: Message) -> None:
-                text = message.text or ""
-                args = text.split(maxsplit=1)[1] if " " in text else "nothing"
-                await message.answer(f"Args: {args}")
-
-            dispatcher.include_router(router)
-
-        client = await TestClient.create(
-            bot_token="123456:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-            setup_dispatcher_func=setup_with_args,
-        )
-
-        user = UserFactory.create()
+        user = user_pool[0]
         responses = await client.send_command(
             command="echo",
             from_user=user,
             args="hello world",
         )
 
-        assert len(responses) == 1
-        assert "hello world" in responses[0].text
+        (response,) = responses
+        assert "hello world" in response.text
 
-        await client.close()
-
-    async def test_send_callback(self):
+    async def test_send_callback(self, client_factory, user_pool):
         """Test sending a callback query."""
-        from aiogram import F
-
-        def setup_callback(bot: Bot, dispatcher: Dispatcher) -> None:
-            router = Router()
-
-            @router.callback_query(F.data == "test")
-            async def callback_handler(callback):
-                await callback.answer("Received!")
-
-            dispatcher.include_router(router)
-
-        client = await TestClient.create(
-            bot_token="123456:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-            setup_dispatcher_func=setup_callback,
-        )
+        client = await client_factory(setup_dispatcher_func=setup_callback)
 
-        user = UserFactory.create()
+        user = user_pool[0]
         responses = await client.send_callback(data="test", from_user=user)
 
         assert len(responses) >= 1
 
-        await client.close()
-
 
+@pytest.mark.xdist_group("dice")
 class TestTestClientDice:
     """Tests for TestClient dice functionality."""
 
-    async def test_set_next_dice_value(self):
-        """Test setting next dice value."""
-        client = await TestClient.create(
-            bot_token="123456:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
+    @pytest.fixture
+    def mock_bot(self):
+        """A bare MockBot: dice tests never touch the dispatcher, so
+        skip the full TestClient stack."""
+        return MockBot(
+            capture=RequestCapture(),
+            token=_BOT_KW["bot_token"],
+            bot_id=_BOT_KW["bot_id"],
+            bot_username=_BOT_KW["bot_username"],
+            bot_first_name=_BOT_KW["bot_first_name"],
         )
 
-        client.set_next_dice_value(6)
-        result = await client.bot.send_dice(chat_id=100)
-
-        assert result.dice.value == 6
-
-        await client.close()
-
-    async def test_set_next_dice_value_queue(self):
-        """Test queuing multiple dice values."""
-        client = await TestClient.create(
-            bot_token="123456:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
+    @pytest.mark.parametrize(
+        "queue",
+        [
+            [6],
+            [2, 4],
+            [2, 4, None],  # None: queue exhausted, falls back to random
+        ],
+    )
+    async def test_set_next_dice_value(self, mock_bot, queue):
+        """Test that queued dice values are consumed in FIFO order."""
+        for value in queue:
+            if value is not None:
+                mock_bot.set_next_dice_value(value)
+
+        # gather keeps submission order, so the queue is consumed FIFO.
+        results = await asyncio.gather(
+            *(mock_bot.send_dice(chat_id=100) for _ in queue)
         )
 
-        client.set_next_dice_value(2)
-        client.set_next_dice_value(4)
-
-        result1 = await client.bot.send_dice(chat_id=100)
-        result2 = await client.bot.send_dice(chat_id=100)
-        result3 = await client.bot.send_dice(chat_id=100)  # Random
-
-        assert result1.dice.value == 2
-        assert result2.dice.value == 4
-        assert 1 <= result3.dice.value <= 6  # Falls back to random
-
-        await client.close()
+        for expected, result in zip(queue, results):
+            if expected is None:
+                assert 1 <= result.dice.value <= 6
+            else:
+                assert result.dice.value == expected
 
 
+@pytest.mark.xdist_group("messaging")
 class TestTestClientReset:
     """Tests for TestClient reset functionality."""
 
-    async def test_reset_clears_capture(self):
+    async def test_reset_clears_capture(
+        self, shared_client_with_simple_dispatcher, user_pool
+    ):
         """Test that reset clears captured requests."""
-        client = await TestClient.create(
-            bot_token="123456:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-            setup_dispatcher_func=create_simple_dispatcher,
-        )
+        client = shared_client_with_simple_dispatcher
+        client.reset()
 
-        user = UserFactory.create()
+        user = user_pool[0]
         await client.send_message(text="Hello", from_user=user)
 
         assert len(client.capture) > 0
@@ -341,27 +356,63 @@ class TestTestClientReset:
 
         assert len(client.capture) == 0
 
-        await client.close()
-
-    async def test_reset_resets_counters(self):
-        """Test that reset resets factory counters."""
-        client = await TestClient.create(
-            bot_token="123456:ABC",
+    async def test_create_with_prebuilt_bot_and_capture(self, client_factory):
+        """Test that create can reuse a pre-built bot and capture."""
+        capture = RequestCapture()
+        bot = MockBot(
+            capture=capture,
+            token="123456:ABC",
             bot_id=123456,
             bot_username="test_bot",
             bot_first_name="Test Bot",
         )
 
+        client = await client_factory(bot=bot, capture=capture)
+
+        assert client.bot is bot
+        assert client.capture is capture
+
+    async def test_reset_for_next_test_clears_capture(
+        self, shared_client_with_simple_dispatcher, user_pool
+    ):
+        """Test that reset_for_next_test clears per-test state."""
+        client = shared_client_with_simple_dispatcher
+        client.reset()
+
+        user = user_pool[0]
+        await client.send_message(text="Hello", from_user=user)
+
+        assert len(client.capture) > 0
+
+        client.reset_for_next_test()
+
+        assert len(client.capture) == 0
+
+    async def test_reset_resets_counters(self, shared_client):
+        """Test that reset resets factory counters."""
         UserFactory.create()
         UserFactory.create()
 
-        initial_counter = UserFactory._user_id_counter
+        shared_client.reset()
 
-        client.reset()
+        assert UserFactory.create().id == 100000
 
-        assert UserFactory._user_id_counter == 100000
+    async def test_fast_reset_keeps_factory_counters(
+        self, shared_client, monkeypatch, user_pool
+    ):
+        """Test that the env-guarded fast reset skips the factory reset."""
+        monkeypatch.setenv("AIOGRAM_TF_FAST_RESET", "1")
+        UserFactory.reset_counter()
+        UserFactory.create()
+        next_id = UserFactory.peek_next_id()
+        await shared_client.bot.send_message(
+            chat_id=user_pool[0].id, text="Hi"
+        )
 
-        await client.close()
+        shared_client.reset()
+
+        assert len(shared_client.capture) == 0
+        assert UserFactory.peek_next_id() == next_id
 
 
 class TestTestClientContextManager:
@@ -369,222 +420,118 @@ class TestTestClientContextManager:
 
     async def test_async_context_manager(self):
         """Test using TestClient as async context manager."""
-        async with await TestClient.create(
-            bot_token="123456:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
+        async with TestClient.session(
+            **_BOT_KW,
             setup_dispatcher_func=create_simple_dispatcher,
         ) as client:
             user = client.create_user()
             responses = await user.send_command("start")
             assert responses[0].text == "Welcome!"
 
-    async def test_context_manager_cleanup(self):
-        """Test that context manager properly cleans up."""
-        shutdown_called = []
+    async def test_startup_emitted_only_once(self):
+        """Test that startup handlers run only once per client."""
+        startup_called = []
 
-        async def on_shutdown():
-            shutdown_called.append(True)
+        async def on_startup():
+            startup_called.append(True)
 
-        client = await TestClient.create(
-            bot_token="123456:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
+        client = await TestClient.create(**_BOT_KW)
 
-        client.dispatcher.shutdown.register(on_shutdown)
+        client.dispatcher.startup.register(on_startup)
 
+        await client.start()
         async with client:
             pass
 
-        assert len(shutdown_called) == 1
-
-
-class TestTestClientForwardedMessages:
-    """Tests for TestClient forwarded message functionality."""
-
-    async def test_send_forwarded_from_user(self):
-        """Test sending a forwarded message from a user."""
-        forward_received = []
-
-        def setup_forward_handler(bot: Bot, dispatcher: Dispatcher) -> None:
-            router = Router()
-
-            @router.message(lambda m: m.forward_origin is not None)
-            async def forward_handler(message: Message) -> None:
-                from aiogram.types import MessageOriginUser
-                if isinstance(message.forward_origin, MessageOriginUser):
-                    forward_received.append(message.forward_origin.sender_user)
-                    await message.answer(
-                        f"Forwarded from: {message.forward_origin.sender_user.first_name}"
-                    )
-
-            dispatcher.include_router(router)
-
-        client = await TestClient.create(
-            bot_token="123456:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-            setup_dispatcher_func=setup_forward_handler,
-        )
-
-        from_user = UserFactory.create(first_name="Forwarder")
-        forward_from = UserFactory.create(first_name="OriginalSender")
-
-        responses = await client.send_forwarded_from_user(
-            text="Original message",
-            from_user=from_user,
-            forward_from=forward_from,
-        )
+        assert len(startup_called) == 1
 
-        assert len(responses) == 1
-        assert "OriginalSender" in responses[0].text
-        assert len(forward_received) == 1
-        assert forward_received[0].first_name == "OriginalSender"
-
-        await client.close()
-
-    async def test_send_forwarded_from_hidden_user(self):
-        """Test sending a forwarded message from a hidden user."""
-        forward_received = []
-
-        def setup_forward_handler(bot: Bot, dispatcher: Dispatcher) -> None:
-            router = Router()
-
-            @router.message(lambda m: m.forward_origin is not None)
-            async def forward_handler(message: Message) -> None:
-                from aiogram.types import MessageOriginHiddenUser
-                if isinstance(message.forward_origin, MessageOriginHiddenUser):
-                    forward_received.append(message.forward_origin.sender_user_name)
-                    await message.answer(
-                        f"Forwarded from hidden: {message.forward_origin.sender_user_name}"
-                    )
-
-            dispatcher.include_router(router)
+    async def test_shutdown_not_emitted_without_startup(self):
+        """Test that close does not emit shutdown if startup never ran."""
+        shutdown_called = []
 
-        client = await TestClient.create(
-            bot_token="123456:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-            setup_dispatcher_func=setup_forward_handler,
-        )
+        async def on_shutdown():
+            shutdown_called.append(True)
 
-        from_user = UserFactory.create(first_name="Forwarder")
+        client = await TestClient.create(**_BOT_KW)
 
-        responses = await client.send_forwarded_from_hidden_user(
-            text="Secret message",
-            from_user=from_user,
-            sender_user_name="Anonymous User",
-        )
-
-        assert len(responses) == 1
-        assert "Anonymous User" in responses[0].text
-        assert len(forward_received) == 1
-        assert forward_received[0] == "Anonymous User"
+        client.dispatcher.shutdown.register(on_shutdown)
 
         await client.close()
 
-    async def test_send_forwarded_from_chat(self):
-        """Test sending a forwarded message from a chat."""
-        forward_received = []
+        assert len(shutdown_called) == 0
 
-        def setup_forward_handler(bot: Bot, dispatcher: Dispatcher) -> None:
-            router = Router()
+    async def test_context_manager_cleanup(self):
+        """Test that context manager properly cleans up."""
+        shutdown_called = []
 
-            @router.message(lambda m: m.forward_origin is not None)
-            async def forward_handler(message: Message) -> None:
-                from aiogram.types import MessageOriginChat
-                if isinstance(message.forward_origin, MessageOriginChat):
-                    forward_received.append(message.forward_origin.sender_chat)
-                    signature = message.forward_origin.author_signature or "no signature"
-                    await message.answer(
-                        f"Forwarded from chat: {message.forward_origin.sender_chat.title}, "
-                        f"signature: {signature}"
-                    )
+        async def on_shutdown():
+            shutdown_called.append(True)
 
-            dispatcher.include_router(router)
+        client = await TestClient.create(**_BOT_KW)
 
-        client = await TestClient.create(
-            bot_token="123456:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-            setup_dispatcher_func=setup_forward_handler,
-        )
+        client.dispatcher.shutdown.register(on_shutdown)
 
-        from_user = UserFactory.create(first_name="Forwarder")
-        sender_chat = ChatFactory.create_group(chat_id=-1001234567890, title="Test Group")
+        async with client:
+            pass
 
-        responses = await client.send_forwarded_from_chat(
-            text="Group message",
-            from_user=from_user,
-            sender_chat=sender_chat,
-            author_signature="Admin",
-        )
+        assert len(shutdown_called) == 1
 
-        assert len(responses) == 1
-        assert "Test Group" in responses[0].text
-        assert "Admin" in responses[0].text
-        assert len(forward_received) == 1
-        assert forward_received[0].title == "Test Group"
 
-        await client.close()
+@pytest.mark.xdist_group("forward")
+class TestTestClientForwardedMessages:
+    """Tests for TestClient forwarded message functionality."""
 
-    async def test_send_forwarded_from_channel(self):
-        """Test sending a forwarded message from a channel."""
-        forward_received = []
-
-        def setup_forward_handler(bot: Bot, dispatcher: Dispatcher) -> None:
-            router = Router()
-
-            @router.message(lambda m: m.forward_origin is not None)
-            async def forward_handler(message: Message) -> None:
-                from aiogram.types import MessageOriginChannel
-                if isinstance(message.forward_origin, MessageOriginChannel):
-                    forward_received.append({
-                        "chat": message.forward_origin.chat,
-                        "message_id": message.forward_origin.message_id,
-                        "signature": message.forward_origin.author_signature,
-                    })
-                    signature = message.forward_origin.author_signature or "no signature"
-                    await message.answer(
-                        f"Forwarded from channel: {message.forward_origin.chat.title}, "
-                        f"msg_id: {message.forward_origin.message_id}, "
-                        f"signature: {signature}"
-                    )
-
-            dispatcher.include_router(router)
-
-        client = await TestClient.create(
-            bot_token="123456:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-            setup_dispatcher_func=setup_forward_handler,
-        )
+    @pytest.mark.parametrize(
+        "method_name,make_kwargs,expected",
+        [
+            (
+                "send_forwarded_from_user",
+                lambda: {"forward_from": UserFactory.create(first_name="OriginalSender")},
+                ["MessageOriginUser", "OriginalSender"],
+            ),
+            (
+                "send_forwarded_from_hidden_user",
+                lambda: {"sender_user_name": "Anonymous User"},
+                ["MessageOriginHiddenUser", "Anonymous User"],
+            ),
+            (
+                "send_forwarded_from_chat",
+                lambda: {
+                    "sender_chat": ChatFactory.create_group(
+                        chat_id=-1001234567890, title="Test Group"
+                    ),
+                    "author_signature": "Admin",
+                },
+                ["MessageOriginChat", "Test Group", "Admin"],
+            ),
+            (
+                "send_forwarded_from_channel",
+                lambda: {
+                    "channel_chat": ChatFactory.create_group(
+                        chat_id=-1001234567890, title="Test Channel"
+                    ),
+                    "channel_message_id": 42,
+                    "author_signature": "Channel Author",
+                },
+                ["MessageOriginChannel", "Test Channel", "42", "Channel Author"],
+            ),
+        ],
+    )
+    async def test_send_forwarded(
+        self, session_client_factory, method_name, make_kwargs, expected
+    ):
+        """Test each forward origin type through one shared handler."""
+        client = await session_client_factory(setup_forward_handler)
+        _forward_origins.clear()
 
         from_user = UserFactory.create(first_name="Forwarder")
-        channel_chat = ChatFactory.create_group(chat_id=-1001234567890, title="Test Channel")
-
-        responses = await client.send_forwarded_from_channel(
-            text="Channel post",
+        responses = await getattr(client, method_name)(
+            text="Original message",
             from_user=from_user,
-            channel_chat=channel_chat,
-            channel_message_id=42,
-            author_signature="Channel Author",
+            **make_kwargs(),
         )
 
-        assert len(responses) == 1
-        assert "Test Channel" in responses[0].text
-        assert "42" in responses[0].text
-        assert "Channel Author" in responses[0].text
-        assert len(forward_received) == 1
-        assert forward_received[0]["chat"].title == "Test Channel"
-        assert forward_received[0]["message_id"] == 42
-        assert forward_received[0]["signature"] == "Channel Author"
-
-        await client.close()
+        (response,) = responses
+        for fragment in expected:
+            assert fragment in response.text
+        assert len(_forward_origins) == 1
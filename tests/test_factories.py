@@ -1,5 +1,8 @@
 """
 Tests for factory classes.
+
+PYTEST_DONT_REWRITE: these are tiny attribute-equality asserts; skipping
+pytest's AST rewriting keeps collection of this large module cheap.
 """
 
 from datetime import datetime
@@ -17,6 +20,7 @@ from aiogram.types import (
     User,
 )
 
+from aiogram_test_framework import factories
 from aiogram_test_framework.factories import (
     CallbackQueryFactory,
     ChatFactory,
@@ -31,7 +35,8 @@ class TestUserFactory:
     """Tests for UserFactory."""
 
     def test_create_user_with_defaults(self):
-        """Test creating a user with default values."""
+        """Test creating a user with default values, including the
+        username generated from the auto-incremented ID."""
         user = UserFactory.create()
 
         assert user.id == 100000
@@ -63,13 +68,22 @@ class TestUserFactory:
 
     def test_user_id_auto_increments(self):
         """Test that user IDs auto-increment."""
-        user1 = UserFactory.create()
-        user2 = UserFactory.create()
-        user3 = UserFactory.create()
+        with UserFactory.frozen_counter():
+            assert UserFactory.peek_next_id() == 100000
+
+            user = UserFactory.create()
+
+            assert user.id == 100000
+            assert UserFactory.peek_next_id() == 100001
+
+    def test_frozen_counter_restores_position(self):
+        """Test that frozen_counter restores the outer counter."""
+        before = UserFactory.peek_next_id()
+
+        with UserFactory.frozen_counter(start=500):
+            assert UserFactory.create().id == 500
 
-        assert user1.id == 100000
-        assert user2.id == 100001
-        assert user3.id == 100002
+        assert UserFactory.peek_next_id() == before
 
     def test_reset_counter(self):
         """Test that reset_counter resets the ID counter."""
@@ -80,11 +94,6 @@ class TestUserFactory:
         user = UserFactory.create()
         assert user.id == 100000
 
-    def test_username_generated_from_id(self):
-        """Test that username is generated from ID when not provided."""
-        user = UserFactory.create(user_id=12345)
-        assert user.username == "test_user_12345"
-
 
 class TestChatFactory:
     """Tests for ChatFactory."""
@@ -125,6 +134,26 @@ class TestChatFactory:
         assert chat.last_name == "Smith"
         assert chat.username == "janesmith"
 
+    def test_create_private_from_user_is_cached(self):
+        """Test that the same Chat object is reused for the same user."""
+        user = UserFactory.create(user_id=790)
+
+        chat1 = ChatFactory.create_private_from_user(user)
+        chat2 = ChatFactory.create_private_from_user(user)
+
+        assert chat1 is chat2
+
+    def test_clear_cache(self):
+        """Test that clear_cache drops cached private chats."""
+        user = UserFactory.create(user_id=791)
+        chat1 = ChatFactory.create_private_from_user(user)
+
+        ChatFactory.clear_cache()
+        chat2 = ChatFactory.create_private_from_user(user)
+
+        assert chat1 is not chat2
+        assert chat1.id == chat2.id
+
     def test_create_group_chat(self):
         """Test creating a group chat."""
         chat = ChatFactory.create_group(
@@ -140,9 +169,9 @@ class TestChatFactory:
 class TestMessageFactory:
     """Tests for MessageFactory."""
 
-    def test_create_message_with_defaults(self):
+    def test_create_message_with_defaults(self, default_user):
         """Test creating a message with default values."""
-        user = UserFactory.create()
+        user = default_user
         message = MessageFactory.create(text="Hello", from_user=user)
 
         assert message.message_id == 1
@@ -152,9 +181,9 @@ class TestMessageFactory:
         assert message.chat.type == "private"
         assert isinstance(message.date, datetime)
 
-    def test_create_message_with_custom_chat(self):
+    def test_create_message_with_custom_chat(self, default_user):
         """Test creating a message with a custom chat."""
-        user = UserFactory.create()
+        user = default_user
         chat = ChatFactory.create_group(chat_id=-100, title="Test Group")
         message = MessageFactory.create(
             text="Hello group",
@@ -165,21 +194,18 @@ class TestMessageFactory:
         assert message.chat.id == -100
         assert message.chat.type == "group"
 
-    def test_message_id_auto_increments(self):
+    def test_message_id_auto_increments(self, default_user):
         """Test that message IDs auto-increment."""
-        user = UserFactory.create()
+        assert MessageFactory.peek_next_id() == 1
 
-        msg1 = MessageFactory.create(text="First", from_user=user)
-        msg2 = MessageFactory.create(text="Second", from_user=user)
-        msg3 = MessageFactory.create(text="Third", from_user=user)
+        message = MessageFactory.create(text="First", from_user=default_user)
 
-        assert msg1.message_id == 1
-        assert msg2.message_id == 2
-        assert msg3.message_id == 3
+        assert message.message_id == 1
+        assert MessageFactory.peek_next_id() == 2
 
-    def test_reset_counter(self):
+    def test_reset_counter(self, default_user):
         """Test that reset_counter resets the message ID counter."""
-        user = UserFactory.create()
+        user = default_user
         MessageFactory.create(text="First", from_user=user)
         MessageFactory.create(text="Second", from_user=user)
         MessageFactory.reset_counter()
@@ -187,16 +213,16 @@ class TestMessageFactory:
         msg = MessageFactory.create(text="New first", from_user=user)
         assert msg.message_id == 1
 
-    def test_create_command_simple(self):
+    def test_create_command_simple(self, default_user):
         """Test creating a simple command message."""
-        user = UserFactory.create()
+        user = default_user
         message = MessageFactory.create_command(command="start", from_user=user)
 
         assert message.text == "/start"
 
-    def test_create_command_with_args(self):
+    def test_create_command_with_args(self, default_user):
         """Test creating a command message with arguments."""
-        user = UserFactory.create()
+        user = default_user
         message = MessageFactory.create_command(
             command="help",
             from_user=user,
@@ -205,9 +231,9 @@ class TestMessageFactory:
 
         assert message.text == "/help topic"
 
-    def test_create_message_with_reply_to(self):
+    def test_create_message_with_reply_to(self, default_user):
         """Test creating a message with reply_to_message."""
-        user = UserFactory.create()
+        user = default_user
         original = MessageFactory.create(text="Original", from_user=user)
         reply = MessageFactory.create(
             text="Reply",
@@ -217,9 +243,9 @@ class TestMessageFactory:
 
         assert reply.reply_to_message == original
 
-    def test_create_message_with_reply_markup(self):
+    def test_create_message_with_reply_markup(self, default_user):
         """Test creating a message with reply markup."""
-        user = UserFactory.create()
+        user = default_user
         keyboard = KeyboardFactory.create_inline_keyboard([
             [("Button", "callback")]
         ])
@@ -231,9 +257,9 @@ class TestMessageFactory:
 
         assert message.reply_markup is not None
 
-    def test_create_message_with_explicit_id(self):
+    def test_create_message_with_explicit_id(self, default_user):
         """Test creating a message with explicit message_id."""
-        user = UserFactory.create()
+        user = default_user
         message = MessageFactory.create(
             text="Explicit ID",
             from_user=user,
@@ -242,9 +268,9 @@ class TestMessageFactory:
 
         assert message.message_id == 999
 
-    def test_create_message_with_explicit_date(self):
+    def test_create_message_with_explicit_date(self, default_user):
         """Test creating a message with explicit date."""
-        user = UserFactory.create()
+        user = default_user
         custom_date = datetime(2024, 1, 15, 12, 30, 0)
         message = MessageFactory.create(
             text="Explicit date",
@@ -254,9 +280,9 @@ class TestMessageFactory:
 
         assert message.date == custom_date
 
-    def test_create_dice_with_defaults(self):
+    def test_create_dice_with_defaults(self, default_user):
         """Test creating a dice message with default values (random)."""
-        user = UserFactory.create()
+        user = default_user
         message = MessageFactory.create_dice(from_user=user)
 
         assert message.dice is not None
@@ -264,54 +290,54 @@ class TestMessageFactory:
         assert 1 <= message.dice.value <= 6  # Random value in range
         assert message.from_user == user
 
-    def test_create_dice_with_specific_value(self):
+    def test_create_dice_with_specific_value(self, default_user):
         """Test creating a dice message with specific value."""
-        user = UserFactory.create()
+        user = default_user
         message = MessageFactory.create_dice(from_user=user, value=6)
 
         assert message.dice.value == 6
         assert message.dice.emoji == "🎲"
 
-    def test_create_dice_with_emoji(self):
+    def test_create_dice_with_emoji(self, default_user):
         """Test creating a dice message with different emoji."""
-        user = UserFactory.create()
+        user = default_user
         message = MessageFactory.create_dice(from_user=user, value=3, emoji="🎯")
 
         assert message.dice.value == 3
         assert message.dice.emoji == "🎯"
 
-    def test_create_dice_basketball_random(self):
+    def test_create_dice_basketball_random(self, default_user):
         """Test basketball dice has correct random range."""
-        user = UserFactory.create()
+        user = default_user
         message = MessageFactory.create_dice(from_user=user, emoji="🏀")
 
         assert 1 <= message.dice.value <= 5  # Basketball range is 1-5
 
-    def test_create_dice_slot_machine_random(self):
+    def test_create_dice_slot_machine_random(self, default_user):
         """Test slot machine dice has correct random range."""
-        user = UserFactory.create()
+        user = default_user
         message = MessageFactory.create_dice(from_user=user, emoji="🎰")
 
         assert 1 <= message.dice.value <= 64  # Slot machine range is 1-64
 
-    def test_create_dice_validates_value_too_high(self):
+    def test_create_dice_validates_value_too_high(self, default_user):
         """Test that dice value validation raises error for too high value."""
-        user = UserFactory.create()
+        user = default_user
         with pytest.raises(ValueError) as exc_info:
             MessageFactory.create_dice(from_user=user, value=7, emoji="🎲")
         assert "out of range" in str(exc_info.value)
         assert "1-6" in str(exc_info.value)
 
-    def test_create_dice_validates_value_too_low(self):
+    def test_create_dice_validates_value_too_low(self, default_user):
         """Test that dice value validation raises error for too low value."""
-        user = UserFactory.create()
+        user = default_user
         with pytest.raises(ValueError) as exc_info:
             MessageFactory.create_dice(from_user=user, value=0, emoji="🎲")
         assert "out of range" in str(exc_info.value)
 
-    def test_create_dice_validates_basketball_value(self):
+    def test_create_dice_validates_basketball_value(self, default_user):
         """Test that basketball dice validates value correctly."""
-        user = UserFactory.create()
+        user = default_user
         # Valid value should work
         message = MessageFactory.create_dice(from_user=user, value=5, emoji="🏀")
         assert message.dice.value == 5
@@ -321,9 +347,9 @@ class TestMessageFactory:
             MessageFactory.create_dice(from_user=user, value=6, emoji="🏀")
         assert "1-5" in str(exc_info.value)
 
-    def test_create_dice_validates_slot_machine_value(self):
+    def test_create_dice_validates_slot_machine_value(self, default_user):
         """Test that slot machine dice validates value correctly."""
-        user = UserFactory.create()
+        user = default_user
         # Valid max value should work
         message = MessageFactory.create_dice(from_user=user, value=64, emoji="🎰")
         assert message.dice.value == 64
@@ -333,9 +359,9 @@ class TestMessageFactory:
             MessageFactory.create_dice(from_user=user, value=65, emoji="🎰")
         assert "1-64" in str(exc_info.value)
 
-    def test_create_forwarded_from_user(self):
+    def test_create_forwarded_from_user(self, default_user):
         """Test creating a message forwarded from another user."""
-        user = UserFactory.create()
+        user = default_user
         original_sender = UserFactory.create(
             first_name="Original",
             last_name="Sender",
@@ -352,9 +378,9 @@ class TestMessageFactory:
         assert isinstance(message.forward_origin, MessageOriginUser)
         assert message.forward_origin.sender_user == original_sender
 
-    def test_create_forwarded_from_hidden_user(self):
+    def test_create_forwarded_from_hidden_user(self, default_user):
         """Test creating a message forwarded from a hidden user."""
-        user = UserFactory.create()
+        user = default_user
         message = MessageFactory.create_forwarded_from_hidden_user(
             text="Hidden forward",
             from_user=user,
@@ -367,9 +393,9 @@ class TestMessageFactory:
         assert isinstance(message.forward_origin, MessageOriginHiddenUser)
         assert message.forward_origin.sender_user_name == "Hidden Sender"
 
-    def test_create_forwarded_from_chat(self):
+    def test_create_forwarded_from_chat(self, default_user):
         """Test creating a message forwarded from a chat."""
-        user = UserFactory.create()
+        user = default_user
         sender_chat = ChatFactory.create_group(chat_id=-100123, title="Source Group")
         message = MessageFactory.create_forwarded_from_chat(
             text="Chat forward",
@@ -385,9 +411,9 @@ class TestMessageFactory:
         assert message.forward_origin.sender_chat == sender_chat
         assert message.forward_origin.author_signature == "Admin"
 
-    def test_create_forwarded_from_channel(self):
+    def test_create_forwarded_from_channel(self, default_user):
         """Test creating a message forwarded from a channel."""
-        user = UserFactory.create()
+        user = default_user
         channel_chat = ChatFactory.create_group(chat_id=-1001234567890, title="Test Channel")
         message = MessageFactory.create_forwarded_from_channel(
             text="Channel forward",
@@ -405,9 +431,9 @@ class TestMessageFactory:
         assert message.forward_origin.message_id == 42
         assert message.forward_origin.author_signature == "Editor"
 
-    def test_create_dice_with_all_explicit_params(self):
+    def test_create_dice_with_all_explicit_params(self, default_user):
         """Test creating a dice message with all explicit parameters."""
-        user = UserFactory.create()
+        user = default_user
         chat = ChatFactory.create_group(chat_id=-100555, title="Dice Group")
         custom_date = datetime(2024, 6, 15, 10, 30, 0)
         message = MessageFactory.create_dice(
@@ -425,9 +451,9 @@ class TestMessageFactory:
         assert message.dice.value == 4
         assert message.dice.emoji == "🎯"
 
-    def test_create_forwarded_from_user_with_all_explicit_params(self):
+    def test_create_forwarded_from_user_with_all_explicit_params(self, default_user):
         """Test creating a forwarded user message with all explicit parameters."""
-        user = UserFactory.create()
+        user = default_user
         forward_from = UserFactory.create(first_name="Forwarder")
         chat = ChatFactory.create_group(chat_id=-100444, title="Forward Group")
         custom_date = datetime(2024, 5, 20, 14, 0, 0)
@@ -449,9 +475,9 @@ class TestMessageFactory:
         assert isinstance(message.forward_origin, MessageOriginUser)
         assert message.forward_origin.date == forward_date
 
-    def test_create_forwarded_from_hidden_user_with_all_explicit_params(self):
+    def test_create_forwarded_from_hidden_user_with_all_explicit_params(self, default_user):
         """Test creating a forwarded hidden user message with all explicit parameters."""
-        user = UserFactory.create()
+        user = default_user
         chat = ChatFactory.create_group(chat_id=-100333, title="Hidden Group")
         custom_date = datetime(2024, 4, 10, 8, 0, 0)
         forward_date = datetime(2024, 4, 9, 6, 0, 0)
@@ -473,9 +499,9 @@ class TestMessageFactory:
         assert message.forward_origin.date == forward_date
         assert message.forward_origin.sender_user_name == "AnonymousExplicit"
 
-    def test_create_forwarded_from_chat_with_all_explicit_params(self):
+    def test_create_forwarded_from_chat_with_all_explicit_params(self, default_user):
         """Test creating a forwarded chat message with all explicit parameters."""
-        user = UserFactory.create()
+        user = default_user
         sender_chat = ChatFactory.create_group(chat_id=-100222, title="Source Chat")
         dest_chat = ChatFactory.create_group(chat_id=-100111, title="Dest Chat")
         custom_date = datetime(2024, 3, 5, 16, 0, 0)
@@ -499,9 +525,9 @@ class TestMessageFactory:
         assert message.forward_origin.date == forward_date
         assert message.forward_origin.sender_chat == sender_chat
 
-    def test_create_forwarded_from_channel_with_all_explicit_params(self):
+    def test_create_forwarded_from_channel_with_all_explicit_params(self, default_user):
         """Test creating a forwarded channel message with all explicit parameters."""
-        user = UserFactory.create()
+        user = default_user
         channel_chat = ChatFactory.create_group(chat_id=-100999, title="Channel Source")
         dest_chat = ChatFactory.create_group(chat_id=-100888, title="Dest Chat")
         custom_date = datetime(2024, 2, 1, 12, 0, 0)
@@ -530,9 +556,9 @@ class TestMessageFactory:
 class TestCallbackQueryFactory:
     """Tests for CallbackQueryFactory."""
 
-    def test_create_callback_query_with_defaults(self):
+    def test_create_callback_query_with_defaults(self, default_user):
         """Test creating a callback query with default values."""
-        user = UserFactory.create()
+        user = default_user
         callback = CallbackQueryFactory.create(data="test_data", from_user=user)
 
         assert callback.id == "1"
@@ -541,9 +567,9 @@ class TestCallbackQueryFactory:
         assert callback.chat_instance == "test_instance"
         assert callback.message is not None
 
-    def test_create_callback_with_custom_message(self):
+    def test_create_callback_with_custom_message(self, default_user):
         """Test creating a callback query with custom message."""
-        user = UserFactory.create()
+        user = default_user
         message = MessageFactory.create(text="Button message", from_user=user)
         callback = CallbackQueryFactory.create(
             data="click",
@@ -553,21 +579,18 @@ class TestCallbackQueryFactory:
 
         assert callback.message == message
 
-    def test_callback_id_auto_increments(self):
+    def test_callback_id_auto_increments(self, default_user):
         """Test that callback IDs auto-increment."""
-        user = UserFactory.create()
+        assert CallbackQueryFactory.peek_next_id() == 1
 
-        cb1 = CallbackQueryFactory.create(data="data1", from_user=user)
-        cb2 = CallbackQueryFactory.create(data="data2", from_user=user)
-        cb3 = CallbackQueryFactory.create(data="data3", from_user=user)
+        callback = CallbackQueryFactory.create(data="data1", from_user=default_user)
 
-        assert cb1.id == "1"
-        assert cb2.id == "2"
-        assert cb3.id == "3"
+        assert callback.id == "1"
+        assert CallbackQueryFactory.peek_next_id() == 2
 
-    def test_reset_counter(self):
+    def test_reset_counter(self, default_user):
         """Test that reset_counter resets the callback ID counter."""
-        user = UserFactory.create()
+        user = default_user
         CallbackQueryFactory.create(data="data", from_user=user)
         CallbackQueryFactory.create(data="data", from_user=user)
         CallbackQueryFactory.reset_counter()
@@ -575,9 +598,9 @@ class TestCallbackQueryFactory:
         cb = CallbackQueryFactory.create(data="data", from_user=user)
         assert cb.id == "1"
 
-    def test_create_callback_with_explicit_id(self):
+    def test_create_callback_with_explicit_id(self, default_user):
         """Test creating a callback query with explicit callback_id."""
-        user = UserFactory.create()
+        user = default_user
         callback = CallbackQueryFactory.create(
             data="test_data",
             from_user=user,
@@ -586,9 +609,9 @@ class TestCallbackQueryFactory:
 
         assert callback.id == "custom_id_123"
 
-    def test_create_callback_with_explicit_id_and_message(self):
+    def test_create_callback_with_explicit_id_and_message(self, default_user):
         """Test creating a callback query with explicit callback_id and message."""
-        user = UserFactory.create()
+        user = default_user
         message = MessageFactory.create(text="Button text", from_user=user)
         callback = CallbackQueryFactory.create(
             data="test_data",
@@ -604,48 +627,46 @@ class TestCallbackQueryFactory:
 class TestUpdateFactory:
     """Tests for UpdateFactory."""
 
-    def test_create_message_update(self):
+    def test_create_message_update(self, default_user):
         """Test creating an update with a message."""
-        user = UserFactory.create()
+        user = default_user
         message = MessageFactory.create(text="Test", from_user=user)
         update = UpdateFactory.create_message_update(message)
 
         assert update.update_id == 1
         assert update.message == message
 
-    def test_create_callback_update(self):
+    def test_create_callback_update(self, default_user):
         """Test creating an update with a callback query."""
-        user = UserFactory.create()
+        user = default_user
         callback = CallbackQueryFactory.create(data="data", from_user=user)
         update = UpdateFactory.create_callback_update(callback)
 
         assert update.update_id == 1
         assert update.callback_query == callback
 
-    def test_update_id_auto_increments(self):
+    def test_update_id_auto_increments(self, default_user):
         """Test that update IDs auto-increment."""
-        user = UserFactory.create()
-        msg1 = MessageFactory.create(text="First", from_user=user)
-        msg2 = MessageFactory.create(text="Second", from_user=user)
+        assert UpdateFactory.peek_next_id() == 1
 
-        upd1 = UpdateFactory.create_message_update(msg1)
-        upd2 = UpdateFactory.create_message_update(msg2)
+        message = MessageFactory.create(text="First", from_user=default_user)
+        update = UpdateFactory.create_message_update(message)
 
-        assert upd1.update_id == 1
-        assert upd2.update_id == 2
+        assert update.update_id == 1
+        assert UpdateFactory.peek_next_id() == 2
 
-    def test_from_text(self):
+    def test_from_text(self, default_user):
         """Test creating an update from text."""
-        user = UserFactory.create()
+        user = default_user
         update = UpdateFactory.from_text(text="Hello world", from_user=user)
 
         assert update.message is not None
         assert update.message.text == "Hello world"
         assert update.message.from_user == user
 
-    def test_from_command(self):
+    def test_from_command(self, default_user):
         """Test creating an update from a command."""
-        user = UserFactory.create()
+        user = default_user
         update = UpdateFactory.from_command(
             command="start",
             from_user=user,
@@ -655,17 +676,17 @@ class TestUpdateFactory:
         assert update.message is not None
         assert update.message.text == "/start deep_link"
 
-    def test_from_callback(self):
+    def test_from_callback(self, default_user):
         """Test creating an update from a callback."""
-        user = UserFactory.create()
+        user = default_user
         update = UpdateFactory.from_callback(data="button_click", from_user=user)
 
         assert update.callback_query is not None
         assert update.callback_query.data == "button_click"
 
-    def test_reset_counter(self):
+    def test_reset_counter(self, default_user):
         """Test that reset_counter resets the update ID counter."""
-        user = UserFactory.create()
+        user = default_user
         msg = MessageFactory.create(text="Test", from_user=user)
         UpdateFactory.create_message_update(msg)
         UpdateFactory.create_message_update(msg)
@@ -674,9 +695,9 @@ class TestUpdateFactory:
         update = UpdateFactory.create_message_update(msg)
         assert update.update_id == 1
 
-    def test_from_dice_random(self):
+    def test_from_dice_random(self, default_user):
         """Test creating an update from dice with random value."""
-        user = UserFactory.create()
+        user = default_user
         update = UpdateFactory.from_dice(from_user=user)
 
         assert update.message is not None
@@ -684,42 +705,42 @@ class TestUpdateFactory:
         assert update.message.dice.emoji == "🎲"
         assert 1 <= update.message.dice.value <= 6
 
-    def test_from_dice_specific_value(self):
+    def test_from_dice_specific_value(self, default_user):
         """Test creating an update from dice with specific value."""
-        user = UserFactory.create()
+        user = default_user
         update = UpdateFactory.from_dice(from_user=user, value=5)
 
         assert update.message.dice.value == 5
 
-    def test_from_dice_with_emoji(self):
+    def test_from_dice_with_emoji(self, default_user):
         """Test creating an update from dice with different emoji."""
-        user = UserFactory.create()
+        user = default_user
         update = UpdateFactory.from_dice(from_user=user, value=4, emoji="🎯")
 
         assert update.message.dice.emoji == "🎯"
         assert update.message.dice.value == 4
 
-    def test_create_message_update_with_explicit_id(self):
+    def test_create_message_update_with_explicit_id(self, default_user):
         """Test creating a message update with explicit update_id."""
-        user = UserFactory.create()
+        user = default_user
         message = MessageFactory.create(text="Test", from_user=user)
         update = UpdateFactory.create_message_update(message, update_id=999)
 
         assert update.update_id == 999
         assert update.message == message
 
-    def test_create_callback_update_with_explicit_id(self):
+    def test_create_callback_update_with_explicit_id(self, default_user):
         """Test creating a callback update with explicit update_id."""
-        user = UserFactory.create()
+        user = default_user
         callback = CallbackQueryFactory.create(data="data", from_user=user)
         update = UpdateFactory.create_callback_update(callback, update_id=888)
 
         assert update.update_id == 888
         assert update.callback_query == callback
 
-    def test_from_forwarded_user(self):
+    def test_from_forwarded_user(self, default_user):
         """Test creating an update from a forwarded user message."""
-        user = UserFactory.create()
+        user = default_user
         original_sender = UserFactory.create(first_name="Original")
         update = UpdateFactory.from_forwarded_user(
             text="Forwarded text",
@@ -733,9 +754,9 @@ class TestUpdateFactory:
         assert isinstance(update.message.forward_origin, MessageOriginUser)
         assert update.message.forward_origin.sender_user == original_sender
 
-    def test_from_forwarded_hidden_user(self):
+    def test_from_forwarded_hidden_user(self, default_user):
         """Test creating an update from a forwarded hidden user message."""
-        user = UserFactory.create()
+        user = default_user
         update = UpdateFactory.from_forwarded_hidden_user(
             text="Hidden forward",
             from_user=user,
@@ -748,9 +769,9 @@ class TestUpdateFactory:
         assert isinstance(update.message.forward_origin, MessageOriginHiddenUser)
         assert update.message.forward_origin.sender_user_name == "Anonymous User"
 
-    def test_from_forwarded_chat(self):
+    def test_from_forwarded_chat(self, default_user):
         """Test creating an update from a forwarded chat message."""
-        user = UserFactory.create()
+        user = default_user
         sender_chat = ChatFactory.create_group(chat_id=-100123, title="Source Group")
         update = UpdateFactory.from_forwarded_chat(
             text="Chat forward",
@@ -766,9 +787,9 @@ class TestUpdateFactory:
         assert update.message.forward_origin.sender_chat == sender_chat
         assert update.message.forward_origin.author_signature == "Admin"
 
-    def test_from_forwarded_channel(self):
+    def test_from_forwarded_channel(self, default_user):
         """Test creating an update from a forwarded channel message."""
-        user = UserFactory.create()
+        user = default_user
         channel_chat = ChatFactory.create_group(chat_id=-1001234567890, title="News Channel")
         update = UpdateFactory.from_forwarded_channel(
             text="Channel post",
@@ -790,47 +811,47 @@ class TestUpdateFactory:
 class TestKeyboardFactory:
     """Tests for KeyboardFactory."""
 
-    def test_create_single_button(self):
-        """Test creating a keyboard with a single button."""
-        keyboard = KeyboardFactory.create_inline_keyboard([
-            [("Click me", "click")]
-        ])
+    @pytest.mark.parametrize(
+        "rows,expected_shape",
+        [
+            ([[("Click me", "click")]], [1]),
+            (
+                [
+                    [("Row 1 Button", "r1")],
+                    [("Row 2 Button", "r2")],
+                    [("Row 3 Button", "r3")],
+                ],
+                [1, 1, 1],
+            ),
+            ([[("Yes", "yes"), ("No", "no")], [("Maybe", "maybe")]], [2, 1]),
+            ([], []),
+        ],
+    )
+    def test_inline_keyboard_shape(self, rows, expected_shape):
+        """Test keyboard layouts: shape, texts and callback data."""
+        keyboard = KeyboardFactory.create_inline_keyboard(rows)
 
         assert isinstance(keyboard, InlineKeyboardMarkup)
-        assert len(keyboard.inline_keyboard) == 1
-        assert len(keyboard.inline_keyboard[0]) == 1
-        assert keyboard.inline_keyboard[0][0].text == "Click me"
-        assert keyboard.inline_keyboard[0][0].callback_data == "click"
+        assert [len(row) for row in keyboard.inline_keyboard] == expected_shape
+        for row, built_row in zip(rows, keyboard.inline_keyboard):
+            for (text, data), button in zip(row, built_row):
+                assert button.text == text
+                assert button.callback_data == data
 
-    def test_create_multiple_rows(self):
-        """Test creating a keyboard with multiple rows."""
-        keyboard = KeyboardFactory.create_inline_keyboard([
-            [("Row 1 Button", "r1")],
-            [("Row 2 Button", "r2")],
-            [("Row 3 Button", "r3")],
-        ])
 
-        assert len(keyboard.inline_keyboard) == 3
-        assert keyboard.inline_keyboard[0][0].callback_data == "r1"
-        assert keyboard.inline_keyboard[1][0].callback_data == "r2"
-        assert keyboard.inline_keyboard[2][0].callback_data == "r3"
+class TestFactoriesValidationFlag:
+    """Tests for the FACTORIES_SKIP_VALIDATION toggle."""
 
-    def test_create_multiple_buttons_per_row(self):
-        """Test creating a keyboard with multiple buttons per row."""
-        keyboard = KeyboardFactory.create_inline_keyboard([
-            [("Yes", "yes"), ("No", "no")],
-            [("Maybe", "maybe")],
-        ])
+    def test_skip_validation_enabled_by_default(self):
+        """Test that factories skip Pydantic validation by default."""
+        assert factories.FACTORIES_SKIP_VALIDATION is True
 
-        assert len(keyboard.inline_keyboard) == 2
-        assert len(keyboard.inline_keyboard[0]) == 2
-        assert len(keyboard.inline_keyboard[1]) == 1
+    def test_validation_can_be_re_enabled(self, monkeypatch):
+        """Test that factories still work with full validation enabled."""
+        monkeypatch.setattr(factories, "FACTORIES_SKIP_VALIDATION", False)
 
-        assert keyboard.inline_keyboard[0][0].text == "Yes"
-        assert keyboard.inline_keyboard[0][1].text == "No"
-        assert keyboard.inline_keyboard[1][0].text == "Maybe"
+        user = UserFactory.create(user_id=1, first_name="John")
+        message = MessageFactory.create(text="Hello", from_user=user)
 
-    def test_create_empty_keyboard(self):
-        """Test creating an empty keyboard."""
-        keyboard = KeyboardFactory.create_inline_keyboard([])
-        assert len(keyboard.inline_keyboard) == 0
+        assert user.first_name == "John"
+        assert message.text == "Hello"
@@ -26,8 +26,22 @@ class Form(StatesGroup):
     confirm = State()
 
 
+# Built once per process: the handler graph (Command/StateFilter/F.data
+# filter objects and closures) is stateless between tests, and
+# TestClient.close() detaches routers so the cached one can be re-attached.
+_ROUTER: Router | None = None
+
+
 def create_full_dispatcher(bot: Bot, dispatcher: Dispatcher) -> None:
     """Create a dispatcher with multiple types of handlers."""
+    global _ROUTER
+    if _ROUTER is not None:
+        # Detach from any previous dispatcher (same trick as
+        # TestClient._reset_dispatcher_routers) before re-attaching.
+        _ROUTER._parent_router = None
+        dispatcher.include_router(_ROUTER)
+        return
+
     router = Router()
 
     @router.message(Command("start"))
@@ -107,21 +121,28 @@ def create_full_dispatcher(bot: Bot, dispatcher: Dispatcher) -> None:
     async def default_handler(message: Message) -> None:
         await message.answer("Unknown command. Use /help for assistance.")
 
+    _ROUTER = router
     dispatcher.include_router(router)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 async def full_client() -> TestClient:
-    """Provide a TestClient with full bot setup."""
-    client = await TestClient.create(
+    """Provide a TestClient with full bot setup, shared per module."""
+    async with TestClient.session(
         bot_token="123456:ABC-DEF",
         bot_id=123456,
         bot_username="test_bot",
         bot_first_name="Test Bot",
         setup_dispatcher_func=create_full_dispatcher,
-    )
-    yield client
-    await client.close()
+    ) as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def _reset_full_client(request):
+    """Reset the shared client between tests that use it."""
+    if "full_client" in request.fixturenames:
+        request.getfixturevalue("full_client").reset_for_next_test()
 
 
 class TestBasicInteractions:
@@ -153,27 +174,34 @@ class TestBasicInteractions:
         assert "Unknown command" in responses[0].text
 
 
+@pytest.fixture
+async def started_user(full_client):
+    """A user who has already run /start, with the capture cleared.
+
+    The button tests only need the keyboard message to exist; dispatching
+    /start inside each test re-runs the handler and pollutes the capture.
+    """
+    user = full_client.create_user()
+    await user.send_command("start")
+    full_client.capture.clear()
+    return user
+
+
 class TestCallbackQueries:
     """Test callback query handling."""
 
-    async def test_begin_button(self, full_client):
+    async def test_begin_button(self, full_client, started_user):
         """Test clicking the Begin button."""
-        user = full_client.create_user()
-
-        await user.send_command("start")
-        responses = await user.click_button("begin")
+        responses = await started_user.click_button("begin")
 
         assert len(responses) >= 1
         edited_messages = full_client.capture.get_edited_messages()
         assert len(edited_messages) >= 1
         assert any("begin" in (m.text or "") for m in edited_messages)
 
-    async def test_help_button(self, full_client):
+    async def test_help_button(self, started_user):
         """Test clicking the Help button."""
-        user = full_client.create_user()
-
-        await user.send_command("start")
-        responses = await user.click_button("help")
+        responses = await started_user.click_button("help")
 
         assert len(responses) >= 1
 
@@ -228,13 +256,25 @@ class TestFSMFlow:
         assert user.has_received_message_containing("valid")
 
 
+@pytest.fixture(scope="module")
+def two_users(full_client):
+    """One pair of users shared by the multi-user tests.
+
+    Users are plain pydantic models plus a client reference; the per-test
+    reset clears capture and FSM storage, so the pair can be reused.
+    """
+    return (
+        full_client.create_user(first_name="User1"),
+        full_client.create_user(first_name="User2"),
+    )
+
+
 class TestMultipleUsers:
     """Test multiple users interacting simultaneously."""
 
-    async def test_independent_user_sessions(self, full_client):
+    async def test_independent_user_sessions(self, two_users):
         """Test that multiple users have independent sessions."""
-        user1 = full_client.create_user(first_name="User1")
-        user2 = full_client.create_user(first_name="User2")
+        user1, user2 = two_users
 
         await user1.send_command("form")
         await user1.send_message("Alice")
@@ -248,10 +288,9 @@ class TestMultipleUsers:
         assert len(user1_msgs) == 2
         assert len(user2_msgs) == 2
 
-    async def test_separate_state_per_user(self, full_client):
+    async def test_separate_state_per_user(self, two_users):
         """Test that FSM state is separate for each user."""
-        user1 = full_client.create_user()
-        user2 = full_client.create_user()
+        user1, user2 = two_users
 
         await user1.send_command("form")
         await user1.send_message("User1Name")
@@ -350,31 +389,19 @@ class TestClientReset:
 class TestEdgeCases:
     """Test edge cases and error handling."""
 
-    async def test_empty_message(self, full_client):
-        """Test handling empty messages."""
-        user = full_client.create_user()
-
-        responses = await user.send_message("")
-        assert len(responses) == 1
-
-    async def test_very_long_message(self, full_client):
-        """Test handling very long messages."""
-        user = full_client.create_user()
-
-        long_text = "A" * 4096
-        responses = await user.send_message(long_text)
-        assert len(responses) == 1
-
-    async def test_special_characters(self, full_client):
-        """Test handling special characters in messages."""
-        user = full_client.create_user()
-
-        responses = await user.send_message("Hello <script>alert('xss')</script>")
-        assert len(responses) == 1
-
-    async def test_unicode_message(self, full_client):
-        """Test handling unicode messages."""
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "A" * 4096,
+            "Hello <script>alert('xss')</script>",
+            "Привіт 🇺🇦 мир 🌍",
+        ],
+        ids=["empty", "long", "special-chars", "unicode"],
+    )
+    async def test_default_handler_accepts(self, full_client, text):
+        """Test that edge-case message texts reach the default handler."""
         user = full_client.create_user()
 
-        responses = await user.send_message("Привіт 🇺🇦 мир 🌍")
+        responses = await user.send_message(text)
         assert len(responses) == 1
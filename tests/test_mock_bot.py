@@ -14,107 +14,122 @@ from aiogram.methods import (
     SendDice,
     SendMessage,
     SendPhoto,
+    SetMyCommands,
+    SetWebhook,
 )
-from aiogram.types import Chat, Dice, Message, User
+from aiogram.types import BotCommand, Chat, Dice, Message, User
 
 from aiogram_test_framework.mock_bot import MockBot, MockSession
 from aiogram_test_framework.request_capture import RequestCapture
-from aiogram_test_framework.types import RequestType
+from aiogram_test_framework.types import CapturedRequest, LazyParams, RequestType
+
+# Keep the whole module on one xdist worker so the module-scoped
+# session/bot fixtures are built once, not once per worker.
+pytestmark = pytest.mark.xdist_group("mock_bot")
+
+# The bot user is shared read-only by every test; build the pydantic
+# model once at import.
+_BOT_USER = User(
+    id=123456,
+    is_bot=True,
+    first_name="Test Bot",
+    username="test_bot",
+)
+
+
+# (method, response check, expected captured request type) for the simple
+# make_request round-trips; the method objects are immutable, so they are
+# built once at import. Stateful paths (dice queue, message id counter,
+# lazy params) keep their own tests below.
+_MAKE_REQUEST_CASES = [
+    (
+        SendMessage(chat_id=100, text="Hello world"),
+        lambda r: isinstance(r, Message)
+        and r.text == "Hello world"
+        and r.chat.id == 100
+        and r.from_user.id == 123456,
+        RequestType.SEND_MESSAGE,
+    ),
+    (
+        EditMessageText(chat_id=100, message_id=1, text="Edited"),
+        lambda r: isinstance(r, Message) and r.text == "Edited",
+        RequestType.EDIT_MESSAGE_TEXT,
+    ),
+    (
+        DeleteMessage(chat_id=100, message_id=1),
+        lambda r: r is True,
+        RequestType.DELETE_MESSAGE,
+    ),
+    (
+        AnswerCallbackQuery(callback_query_id="123"),
+        lambda r: r is True,
+        RequestType.ANSWER_CALLBACK_QUERY,
+    ),
+    (
+        GetMe(),
+        # getMe returns the session's bot_user instance itself.
+        lambda r: r is _BOT_USER,
+        RequestType.GET_ME,
+    ),
+    (
+        GetChat(chat_id=100),
+        lambda r: isinstance(r, Chat) and r.id == 100,
+        RequestType.GET_CHAT,
+    ),
+    (
+        GetChatMember(chat_id=100, user_id=999),
+        lambda r: r.user.id == 999,
+        RequestType.GET_CHAT_MEMBER,
+    ),
+    (
+        SendPhoto(chat_id=100, photo="photo_file_id", caption="Test caption"),
+        lambda r: isinstance(r, Message)
+        and r.chat.id == 100
+        and len(r.photo or ()) == 1
+        and r.caption == "Test caption"
+        and r.from_user.id == 123456,
+        RequestType.SEND_PHOTO,
+    ),
+    (
+        SetMyCommands(
+            commands=[BotCommand(command="test", description="Test")]
+        ),
+        lambda r: r is True,
+        RequestType.SET_MY_COMMANDS,
+    ),
+    (
+        SetWebhook(url="https://example.com/webhook"),
+        lambda r: r is True,
+        RequestType.OTHER,
+    ),
+]
 
 
 class TestMockSession:
     """Tests for MockSession."""
 
-    @pytest.fixture
+    # The bot user, capture, session and bot are all stateless between
+    # tests once the capture and counters are cleared, so they are built
+    # once per module; the autouse fixture below resets them per test.
+    @pytest.fixture(scope="module")
     def bot_user(self):
-        """Provide a bot user."""
-        return User(
-            id=123456,
-            is_bot=True,
-            first_name="Test Bot",
-            username="test_bot",
-        )
+        """Provide the shared bot user."""
+        return _BOT_USER
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
+    def capture(self):
+        """Provide one RequestCapture shared by the session and bot."""
+        return RequestCapture()
+
+    @pytest.fixture(scope="module")
     def session(self, capture, bot_user):
         """Provide a MockSession instance."""
         return MockSession(capture=capture, bot_user=bot_user)
 
-    async def test_make_request_sends_message(self, session, capture, bot_user):
-        """Test that make_request captures sendMessage requests."""
-        bot = MockBot(
-            capture=capture,
-            token="123:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
-        method = SendMessage(chat_id=100, text="Hello world")
-        response = await session.make_request(bot, method)
-
-        assert isinstance(response, Message)
-        assert response.text == "Hello world"
-        assert response.chat.id == 100
-        assert response.from_user == bot_user
-        assert len(capture) == 1
-        assert capture.all_requests[0].request_type == RequestType.SEND_MESSAGE
-
-    async def test_make_request_edit_message(self, session, capture, bot_user):
-        """Test that make_request handles editMessageText."""
-        bot = MockBot(
-            capture=capture,
-            token="123:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
-        method = EditMessageText(chat_id=100, message_id=1, text="Edited")
-        response = await session.make_request(bot, method)
-
-        assert isinstance(response, Message)
-        assert response.text == "Edited"
-        assert len(capture) == 1
-        assert capture.all_requests[0].request_type == RequestType.EDIT_MESSAGE_TEXT
-
-    async def test_make_request_delete_message(self, session, capture, bot_user):
-        """Test that make_request handles deleteMessage."""
-        bot = MockBot(
-            capture=capture,
-            token="123:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
-        method = DeleteMessage(chat_id=100, message_id=1)
-        response = await session.make_request(bot, method)
-
-        assert response is True
-        assert len(capture) == 1
-        assert capture.all_requests[0].request_type == RequestType.DELETE_MESSAGE
-
-    async def test_make_request_answer_callback(self, session, capture, bot_user):
-        """Test that make_request handles answerCallbackQuery."""
-        bot = MockBot(
-            capture=capture,
-            token="123:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
-        method = AnswerCallbackQuery(callback_query_id="123")
-        response = await session.make_request(bot, method)
-
-        assert response is True
-        assert len(capture) == 1
-        assert capture.all_requests[0].request_type == RequestType.ANSWER_CALLBACK_QUERY
-
-    async def test_make_request_get_me(self, session, capture, bot_user):
-        """Test that make_request handles getMe."""
-        bot = MockBot(
+    @pytest.fixture(scope="module")
+    def bot(self, capture):
+        """Provide a MockBot built once for the module."""
+        return MockBot(
             capture=capture,
             token="123:ABC",
             bot_id=123456,
@@ -122,60 +137,47 @@ class TestMockSession:
             bot_first_name="Test Bot",
         )
 
-        method = GetMe()
+    @pytest.fixture(autouse=True)
+    def _reset_state(self, capture, session):
+        """Clear shared state before each test."""
+        capture.clear()
+        session.reset_message_counter()
+
+    @pytest.mark.parametrize(
+        "method,check,rtype",
+        _MAKE_REQUEST_CASES,
+        ids=[case[2] for case in _MAKE_REQUEST_CASES],
+    )
+    async def test_make_request(self, session, capture, bot, method, check, rtype):
+        """Test the make_request round-trip for each supported method."""
         response = await session.make_request(bot, method)
 
-        assert response == bot_user
+        assert check(response)
+        requests = capture.all_requests
+        assert len(requests) == 1
+        assert requests[0].request_type == rtype
 
-    async def test_make_request_send_dice(self, session, capture, bot_user):
+    async def test_make_request_send_dice(self, session, capture, bot_user, bot):
         """Test that make_request handles sendDice."""
-        bot = MockBot(
-            capture=capture,
-            token="123:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
         method = SendDice(chat_id=100)
         response = await session.make_request(bot, method)
 
         assert isinstance(response, Message)
-        assert response.dice is not None
-        assert isinstance(response.dice, Dice)
+        assert type(response.dice) is Dice
         assert 1 <= response.dice.value <= 6  # Random value in valid range
 
-    async def test_make_request_send_dice_with_configured_value(self, session, capture, bot_user):
+    async def test_make_request_send_dice_with_configured_value(self, session, capture, bot_user, bot):
         """Test that make_request uses configured dice value."""
-        bot = MockBot(
-            capture=capture,
-            token="123:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
         session.set_next_dice_value(6)
         method = SendDice(chat_id=100)
         response = await session.make_request(bot, method)
 
         assert isinstance(response, Message)
-        assert response.dice is not None
         assert response.dice.value == 6
 
-    async def test_make_request_send_dice_queued_values(self, session, capture, bot_user):
+    async def test_make_request_send_dice_queued_values(self, session, capture, bot_user, bot):
         """Test that multiple dice values can be queued."""
-        bot = MockBot(
-            capture=capture,
-            token="123:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
-        session.set_next_dice_value(3)
-        session.set_next_dice_value(5)
-        session.set_next_dice_value(2)
+        session.set_next_dice_values(3, 5, 2)
 
         method = SendDice(chat_id=100)
         response1 = await session.make_request(bot, method)
@@ -188,16 +190,8 @@ class TestMockSession:
         assert response3.dice.value == 2
         assert 1 <= response4.dice.value <= 6  # Falls back to random
 
-    async def test_make_request_send_dice_with_emoji(self, session, capture, bot_user):
+    async def test_make_request_send_dice_with_emoji(self, session, capture, bot_user, bot):
         """Test that sendDice preserves emoji."""
-        bot = MockBot(
-            capture=capture,
-            token="123:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
         session.set_next_dice_value(4)
         method = SendDice(chat_id=100, emoji="🎳")
         response = await session.make_request(bot, method)
@@ -205,183 +199,78 @@ class TestMockSession:
         assert response.dice.emoji == "🎳"
         assert response.dice.value == 4
 
-    async def test_make_request_send_dice_basketball_random(self, session, capture, bot_user):
+    async def test_make_request_send_dice_basketball_random(self, session, capture, bot_user, bot):
         """Test that sendDice with basketball emoji returns value 1-5."""
-        bot = MockBot(
-            capture=capture,
-            token="123:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
         method = SendDice(chat_id=100, emoji="🏀")
         response = await session.make_request(bot, method)
 
         assert response.dice.emoji == "🏀"
         assert 1 <= response.dice.value <= 5
 
-    async def test_make_request_send_dice_football_random(self, session, capture, bot_user):
+    async def test_make_request_send_dice_football_random(self, session, capture, bot_user, bot):
         """Test that sendDice with football emoji returns value 1-5."""
-        bot = MockBot(
-            capture=capture,
-            token="123:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
         method = SendDice(chat_id=100, emoji="⚽")
         response = await session.make_request(bot, method)
 
         assert response.dice.emoji == "⚽"
         assert 1 <= response.dice.value <= 5
 
-    async def test_make_request_send_dice_slot_machine_random(self, session, capture, bot_user):
+    async def test_make_request_send_dice_slot_machine_random(self, session, capture, bot_user, bot):
         """Test that sendDice with slot machine emoji returns value 1-64."""
-        bot = MockBot(
-            capture=capture,
-            token="123:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
         method = SendDice(chat_id=100, emoji="🎰")
         response = await session.make_request(bot, method)
 
         assert response.dice.emoji == "🎰"
         assert 1 <= response.dice.value <= 64
 
-    async def test_make_request_get_chat(self, session, capture, bot_user):
-        """Test that make_request handles getChat."""
-        bot = MockBot(
-            capture=capture,
-            token="123:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
-        method = GetChat(chat_id=100)
-        response = await session.make_request(bot, method)
-
-        assert isinstance(response, Chat)
-        assert response.id == 100
-
-    async def test_make_request_get_chat_member(self, session, capture, bot_user):
-        """Test that make_request handles getChatMember."""
-        bot = MockBot(
-            capture=capture,
-            token="123:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
-        method = GetChatMember(chat_id=100, user_id=999)
-        response = await session.make_request(bot, method)
-
-        assert response.user.id == 999
-
-    async def test_message_id_counter(self, session, capture, bot_user):
+    async def test_message_id_counter(self, session, bot):
         """Test that message IDs increment correctly."""
-        bot = MockBot(
-            capture=capture,
-            token="123:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
-        method1 = SendMessage(chat_id=100, text="First")
-        method2 = SendMessage(chat_id=100, text="Second")
-        method3 = SendMessage(chat_id=100, text="Third")
+        for expected_id in range(1, 11):
+            response = await session.make_request(
+                bot, SendMessage(chat_id=100, text=f"m{expected_id}")
+            )
+            assert response.message_id == expected_id
 
-        response1 = await session.make_request(bot, method1)
-        response2 = await session.make_request(bot, method2)
-        response3 = await session.make_request(bot, method3)
+    async def test_stream_content(self, session):
+        """Test stream_content yields a single empty chunk."""
+        gen = session.stream_content("http://example.com")
 
-        assert response1.message_id == 1
-        assert response2.message_id == 2
-        assert response3.message_id == 3
-
-    async def test_stream_content(self, session, capture, bot_user):
-        """Test stream_content yields empty bytes."""
-        async for chunk in session.stream_content("http://example.com"):
-            assert chunk == b""
+        assert await anext(gen) == b""
+        with pytest.raises(StopAsyncIteration):
+            await anext(gen)
 
     async def test_close(self, session, capture, bot_user):
         """Test close is a no-op."""
         await session.close()
 
-    async def test_unknown_method_returns_true(self, session, capture, bot_user):
-        """Test that unknown methods return True."""
-        from aiogram.methods import SetMyCommands
-        from aiogram.types import BotCommand
-
-        bot = MockBot(
-            capture=capture,
-            token="123:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
-        method = SetMyCommands(commands=[BotCommand(command="test", description="Test")])
-        response = await session.make_request(bot, method)
-
-        assert response is True
-
-    async def test_unknown_method_returns_other_request_type(self, session, capture, bot_user):
-        """Test that unknown methods get RequestType.OTHER."""
-        from aiogram.methods import SetWebhook
-
-        bot = MockBot(
-            capture=capture,
-            token="123:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
-        method = SetWebhook(url="https://example.com/webhook")
-        await session.make_request(bot, method)
-
-        assert len(capture) == 1
-        assert capture.all_requests[0].request_type == RequestType.OTHER
-
-    async def test_send_photo(self, session, capture, bot_user):
-        """Test that make_request handles sendPhoto."""
-        from aiogram.types import FSInputFile
+    async def test_captured_params_are_lazy(self, session, capture, bot_user, bot):
+        """Test that captured params defer the model dump until first read."""
+        # deleteMessage's handler never reads params, so nothing should
+        # have been dumped yet.
+        await session.make_request(bot, DeleteMessage(chat_id=100, message_id=1))
 
-        bot = MockBot(
-            capture=capture,
-            token="123:ABC",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
-        method = SendPhoto(chat_id=100, photo="photo_file_id", caption="Test caption")
-        response = await session.make_request(bot, method)
-
-        assert isinstance(response, Message)
-        assert response.chat.id == 100
-        assert response.photo is not None
-        assert len(response.photo) == 1
-        assert response.caption == "Test caption"
-        assert response.from_user == bot_user
-        assert len(capture) == 1
-        assert capture.all_requests[0].request_type == RequestType.SEND_PHOTO
+        params = capture.all_requests[0].params
+        assert isinstance(params, LazyParams)
+        assert params._cached is None
+        assert params["chat_id"] == 100
+        assert params._cached is not None
+        assert params.get("message_id") == 1
 
 
 class TestMockBot:
     """Tests for MockBot."""
 
-    def test_init(self, capture):
-        """Test MockBot initialization."""
-        bot = MockBot(
+    @pytest.fixture(scope="module")
+    def capture(self):
+        """Provide one RequestCapture shared with the bot."""
+        return RequestCapture()
+
+    @pytest.fixture(scope="module")
+    def bot(self, capture):
+        """Provide a MockBot built once for the module; the aiogram Bot
+        constructor (token validation, session wiring) runs a single
+        time instead of per test."""
+        return MockBot(
             capture=capture,
             token="123456:ABC-DEF",
             bot_id=123456,
@@ -389,39 +278,30 @@ class TestMockBot:
             bot_first_name="Test Bot",
         )
 
+    @pytest.fixture(autouse=True)
+    def _reset_state(self, bot):
+        """Clear shared bot state before each test."""
+        bot.reset_capture()
+        bot.reset_message_counter()
+
+    def test_init(self, bot, capture):
+        """Test MockBot initialization."""
         assert bot.capture == capture
         assert bot.bot_user.id == 123456
         assert bot.bot_user.is_bot is True
         assert bot.bot_user.first_name == "Test Bot"
         assert bot.bot_user.username == "test_bot"
 
-    async def test_send_message(self, capture):
+    async def test_send_message(self, bot, capture):
         """Test sending a message through MockBot."""
-        bot = MockBot(
-            capture=capture,
-            token="123456:ABC-DEF",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
         result = await bot.send_message(chat_id=100, text="Hello")
 
         assert isinstance(result, Message)
         assert result.text == "Hello"
         assert len(capture) == 1
 
-    def test_reset_capture(self, capture):
+    def test_reset_capture(self, bot, capture):
         """Test resetting captured requests."""
-        bot = MockBot(
-            capture=capture,
-            token="123456:ABC-DEF",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
-        from aiogram_test_framework.types import CapturedRequest
         capture.add(CapturedRequest(
             request_type=RequestType.SEND_MESSAGE,
             params={"chat_id": 100, "text": "Test"},
@@ -431,47 +311,24 @@ class TestMockBot:
         bot.reset_capture()
         assert len(capture) == 0
 
-    def test_reset_message_counter(self, capture):
-        """Test resetting the message counter."""
-        bot = MockBot(
-            capture=capture,
-            token="123456:ABC-DEF",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
+    def test_reset_message_counter(self, bot):
+        """Test setting and resetting the message counter."""
+        bot.set_message_counter(100)
+        assert bot._mock_session._get_next_message_id() == 100
 
-        bot._mock_session._message_id_counter = 100
         bot.reset_message_counter()
-        assert bot._mock_session._message_id_counter == 1
+        assert bot._mock_session._get_next_message_id() == 1
 
-    async def test_set_next_dice_value(self, capture):
+    async def test_set_next_dice_value(self, bot):
         """Test setting next dice value through MockBot."""
-        bot = MockBot(
-            capture=capture,
-            token="123456:ABC-DEF",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
         bot.set_next_dice_value(5)
         result = await bot.send_dice(chat_id=100)
 
         assert result.dice.value == 5
 
-    async def test_set_next_dice_value_multiple(self, capture):
+    async def test_set_next_dice_value_multiple(self, bot):
         """Test queuing multiple dice values through MockBot."""
-        bot = MockBot(
-            capture=capture,
-            token="123456:ABC-DEF",
-            bot_id=123456,
-            bot_username="test_bot",
-            bot_first_name="Test Bot",
-        )
-
-        bot.set_next_dice_value(1)
-        bot.set_next_dice_value(6)
+        bot.set_next_dice_values(1, 6)
 
         result1 = await bot.send_dice(chat_id=100)
         result2 = await bot.send_dice(chat_id=100)
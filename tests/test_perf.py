@@ -0,0 +1,74 @@
+"""
+Performance regression guards for hot TestClient paths.
+
+pytest-benchmark disables itself under pytest-xdist, and the default
+addopts enable xdist — so benchmark runs must switch it off:
+
+    pytest tests/test_perf.py -p xdist -n 0 --benchmark-only \\
+        --benchmark-save=baseline
+
+records a baseline, and adding `--benchmark-compare` (with the same
+`-p xdist -n 0`) fails on regressions. Under the default (xdist)
+invocation these run as plain smoke tests without timing.
+"""
+
+import asyncio
+
+import pytest
+from aiogram import Bot, Dispatcher, Router
+from aiogram.types import Message
+
+from aiogram_test_framework import TestClient
+from aiogram_test_framework.factories import UserFactory
+
+_BOT_KW = {
+    "bot_token": "123456:ABC",
+    "bot_id": 123456,
+    "bot_username": "test_bot",
+    "bot_first_name": "Test Bot",
+}
+
+
+async def _echo_handler(message: Message) -> None:
+    await message.answer(f"You said: {message.text}")
+
+
+def _setup_echo(bot: Bot, dispatcher: Dispatcher) -> None:
+    router = Router()
+    router.message.register(_echo_handler)
+    dispatcher.include_router(router)
+
+
+class TestPerformance:
+    """Benchmarks for the paths every test goes through."""
+
+    @pytest.fixture
+    def loop(self):
+        """A dedicated event loop for driving benchmarked coroutines."""
+        loop = asyncio.new_event_loop()
+        yield loop
+        loop.close()
+
+    def test_create_benchmark(self, benchmark, loop):
+        """Measure TestClient cold start and teardown."""
+
+        async def create_and_close():
+            client = await TestClient.create(**_BOT_KW)
+            await client.close()
+
+        benchmark(lambda: loop.run_until_complete(create_and_close()))
+
+    def test_send_message_benchmark(self, benchmark, loop):
+        """Measure send_message round-trip through the dispatcher."""
+        client = loop.run_until_complete(
+            TestClient.create(**_BOT_KW, setup_dispatcher_func=_setup_echo)
+        )
+        user = UserFactory.create()
+
+        benchmark(
+            lambda: loop.run_until_complete(
+                client.send_message(text="Hello", from_user=user)
+            )
+        )
+
+        loop.run_until_complete(client.close())
@@ -42,6 +42,110 @@ class TestRequestCapture:
         capture.clear()
         assert len(capture) == 0
 
+    def test_disabled_capture_ignores_requests(self):
+        """Test that a disabled capture drops added requests."""
+        capture = RequestCapture(enabled=False)
+        capture.add(
+            CapturedRequest(
+                request_type=RequestType.SEND_MESSAGE,
+                params={"chat_id": 123, "text": "Hello"},
+            )
+        )
+
+        assert len(capture) == 0
+
+        capture.enabled = True
+        capture.add(
+            CapturedRequest(
+                request_type=RequestType.SEND_MESSAGE,
+                params={"chat_id": 123, "text": "Hello"},
+            )
+        )
+        assert len(capture) == 1
+
+    def test_since(self, capture):
+        """Test getting requests captured from a given index onward."""
+        first = CapturedRequest(
+            request_type=RequestType.SEND_MESSAGE,
+            params={"chat_id": 123, "text": "First"},
+        )
+        second = CapturedRequest(
+            request_type=RequestType.SEND_MESSAGE,
+            params={"chat_id": 123, "text": "Second"},
+        )
+        capture.add(first)
+        index = len(capture)
+        capture.add(second)
+
+        assert capture.since(index) == [second]
+        assert capture.since(0) == [first, second]
+
+    def test_mark_and_view(self, capture):
+        """Test the zero-copy mark/view pair."""
+        first = CapturedRequest(
+            request_type=RequestType.SEND_MESSAGE,
+            params={"chat_id": 123, "text": "First"},
+        )
+        second = CapturedRequest(
+            request_type=RequestType.SEND_MESSAGE,
+            params={"chat_id": 123, "text": "Second"},
+        )
+        capture.add(first)
+        mark = capture.mark()
+        view = capture.view(mark)
+
+        assert len(view) == 0
+
+        capture.add(second)
+
+        assert len(view) == 1
+        assert view[0] is second
+        assert view[-1] is second
+        assert list(view) == [second]
+
+        with pytest.raises(IndexError):
+            view[1]
+
+    def test_view_with_stop_is_snapshot(self, capture):
+        """Test that a bounded view ignores requests added later."""
+        first = CapturedRequest(
+            request_type=RequestType.SEND_MESSAGE,
+            params={"chat_id": 123, "text": "First"},
+        )
+        capture.add(first)
+        view = capture.view(0, capture.mark())
+
+        capture.add(CapturedRequest(
+            request_type=RequestType.SEND_MESSAGE,
+            params={"chat_id": 123, "text": "Second"},
+        ))
+
+        assert len(view) == 1
+        assert list(view) == [first]
+        with pytest.raises(IndexError):
+            view[1]
+
+    def test_view_empty_after_clear(self, capture):
+        """Test that a held view is empty, not broken, after clear()."""
+        capture.add(CapturedRequest(
+            request_type=RequestType.SEND_MESSAGE,
+            params={"chat_id": 123, "text": "First"},
+        ))
+        view = capture.view(1)
+        capture.add(CapturedRequest(
+            request_type=RequestType.SEND_MESSAGE,
+            params={"chat_id": 123, "text": "Second"},
+        ))
+        assert len(view) == 1
+
+        capture.clear()
+
+        assert len(view) == 0
+        assert bool(view) is False
+        assert list(view) == []
+        with pytest.raises(IndexError):
+            view[0]
+
     def test_get_by_type(self, capture):
         """Test getting requests by type."""
         msg_request = CapturedRequest(
@@ -334,6 +438,18 @@ class TestRequestCapture:
         assert capture.has_message_containing("world") is True
         assert capture.has_message_containing("NotFound") is False
 
+    def test_has_message_containing_case_insensitive(self, capture):
+        """Test case-insensitive message text matching."""
+        capture.add(CapturedRequest(
+            request_type=RequestType.SEND_MESSAGE,
+            params={"chat_id": 100, "text": "Hello World"},
+        ))
+
+        assert capture.has_message_containing("hello") is False
+        assert capture.has_message_containing("hello", case_insensitive=True) is True
+        assert capture.has_message_containing("WORLD", case_insensitive=True) is True
+        assert capture.has_message_containing("missing", case_insensitive=True) is False
+
     def test_has_message_containing_with_chat_filter(self, capture):
         """Test has_message_containing with chat filter."""
         msg1 = CapturedRequest(
@@ -5,10 +5,17 @@ Tests for TestUser class.
 import pytest
 from aiogram import Bot, Dispatcher, Router
 from aiogram.filters import Command
-from aiogram.types import Message
+from aiogram.types import (
+    Message,
+    MessageOriginChannel,
+    MessageOriginChat,
+    MessageOriginHiddenUser,
+    MessageOriginUser,
+)
 
 from aiogram_test_framework import TestClient
 from aiogram_test_framework.factories import ChatFactory, UserFactory
+from aiogram_test_framework.request_capture import RequestCapture
 from aiogram_test_framework.user import TestUser
 
 
@@ -37,17 +44,9 @@ def create_test_dispatcher(bot: Bot, dispatcher: Dispatcher) -> None:
 
 
 @pytest.fixture
-async def client() -> TestClient:
+async def client(session_client_factory) -> TestClient:
     """Provide a TestClient with handlers."""
-    client = await TestClient.create(
-        bot_token="123456:ABC",
-        bot_id=123456,
-        bot_username="test_bot",
-        bot_first_name="Test Bot",
-        setup_dispatcher_func=create_test_dispatcher,
-    )
-    yield client
-    await client.close()
+    return await session_client_factory(create_test_dispatcher)
 
 
 class TestTestUser:
@@ -76,6 +75,18 @@ class TestTestUser:
         assert len(responses) == 1
         assert responses[0].text == "Echo: Hello bot"
 
+    async def test_send_messages_batch(self, client):
+        """Test sending several messages in one call."""
+        user = client.create_user()
+        batches = await user.send_messages(["One", "Two", "Three"])
+
+        assert len(batches) == 3
+        assert [batch[0].text for batch in batches] == [
+            "Echo: One",
+            "Echo: Two",
+            "Echo: Three",
+        ]
+
     async def test_send_command(self, client):
         """Test sending a command."""
         user = client.create_user()
@@ -162,7 +173,7 @@ class TestTestUser:
         user = client.create_user()
         original_client = user._client
 
-        new_capture = type(client.capture)()
+        new_capture = RequestCapture()
         user.change_client(client)
 
         assert user._client == client
@@ -192,6 +203,21 @@ class TestTestUser:
         assert "You rolled: 3" in responses[0].text
 
 
+# Formatters keyed by concrete origin type: one dict lookup per message
+# instead of a chain of isinstance checks that grows with origin kinds.
+_ORIGIN_FORMATTERS = {
+    MessageOriginUser: lambda o: f"From user: {o.sender_user.first_name}",
+    MessageOriginHiddenUser: lambda o: f"From hidden: {o.sender_user_name}",
+    MessageOriginChat: lambda o: (
+        f"From chat: {o.sender_chat.title}, sig: {o.author_signature or 'none'}"
+    ),
+    MessageOriginChannel: lambda o: (
+        f"From channel: {o.chat.title}, id: {o.message_id}, "
+        f"sig: {o.author_signature or 'none'}"
+    ),
+}
+
+
 class TestTestUserForwardedMessages:
     """Tests for TestUser forwarded message methods."""
 
@@ -200,41 +226,23 @@ class TestTestUserForwardedMessages:
         """Provide a TestClient with forward handlers."""
 
         def setup_forward_handlers(bot, dispatcher):
-            from aiogram.types import (
-                MessageOriginUser,
-                MessageOriginHiddenUser,
-                MessageOriginChat,
-                MessageOriginChannel,
-            )
             router = Router()
 
             @router.message(lambda m: m.forward_origin is not None)
             async def forward_handler(message: Message) -> None:
                 origin = message.forward_origin
-                if isinstance(origin, MessageOriginUser):
-                    await message.answer(f"From user: {origin.sender_user.first_name}")
-                elif isinstance(origin, MessageOriginHiddenUser):
-                    await message.answer(f"From hidden: {origin.sender_user_name}")
-                elif isinstance(origin, MessageOriginChat):
-                    sig = origin.author_signature or "none"
-                    await message.answer(f"From chat: {origin.sender_chat.title}, sig: {sig}")
-                elif isinstance(origin, MessageOriginChannel):
-                    sig = origin.author_signature or "none"
-                    await message.answer(
-                        f"From channel: {origin.chat.title}, id: {origin.message_id}, sig: {sig}"
-                    )
+                await message.answer(_ORIGIN_FORMATTERS[type(origin)](origin))
 
             dispatcher.include_router(router)
 
-        client = await TestClient.create(
+        async with TestClient.session(
             bot_token="123456:ABC",
             bot_id=123456,
             bot_username="test_bot",
             bot_first_name="Test Bot",
             setup_dispatcher_func=setup_forward_handlers,
-        )
-        yield client
-        await client.close()
+        ) as client:
+            yield client
 
     async def test_send_forwarded_from_user(self, forward_client):
         """Test sending a forwarded message from another user."""